@@ -6,7 +6,8 @@ Step 4: LangChain basic agent implementation
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 
 # Load environment variables from .env file
@@ -42,6 +43,50 @@ except ImportError as e:
     print(f"⚠️ Tools import error: {e}")
 
 
+# Conversation turns (user + assistant message pairs) sent back to the LLM as context
+MAX_CONTEXT_TURNS = 12
+
+# Progress line streamed when the agent calls a tool, ahead of its final answer
+TOOL_PROGRESS_TEMPLATE = "🔧 Running `{tool}`...\n\n"
+
+# Intent keywords for the rule-based fallback, compiled once at import.
+# Lookaheads let one pattern require several keywords in any order.
+_GREETING_RE = re.compile(r"\b(?:hello|hi|hey)\b")
+_CONNECT_RE = re.compile(r"^(?=.*\bconnect)(?=.*\bclusters?\b)", re.DOTALL)
+_STATUS_RE = re.compile(r"\bstatus\b|^(?=.*\bclusters?\b)(?=.*\boverview\b)", re.DOTALL)
+_NODES_RE = re.compile(r"\bnodes\b")
+_PODS_RE = re.compile(r"\bpods\b")
+_NAMESPACES_RE = re.compile(r"\bnamespaces?\b")
+_POD_NAMESPACE_RE = re.compile(r"\b(kube-system|default)\b")
+
+# Static fallback replies, built once at import
+GREETING_TEXT = """👋 Hello! I'm KubeGenie, your AI Kubernetes Assistant.
+
+**Current Status:** 
+- 🤖 Chat: ✅ Active (Fallback mode)
+- 🔗 Kubernetes: ✅ Available
+
+**I can help you with:**
+- Connect to cluster
+- Show cluster status  
+- List nodes, pods, namespaces
+- Basic Kubernetes operations
+
+Try asking me about your cluster!"""
+
+COMMANDS_HELP_TEXT = """**Available Commands:**
+- "Connect to cluster" - Connect to your Kubernetes cluster
+- "Show cluster status" - Get cluster overview
+- "List nodes" - Show all cluster nodes
+- "Show pods" or "List pods" - Show all pods
+- "Show pods in kube-system" - Pods in specific namespace
+- "List namespaces" - Show all namespaces
+
+**💡 Tip:** Even without OpenAI, I can perform all Kubernetes operations!"""
+
+NOT_CONNECTED_MESSAGE = "❌ Not connected to cluster. Please connect first with: 'Connect to cluster'"
+
+
 class KubeGenieAgent:
     """Main LangChain agent for KubeGenie AI Kubernetes Assistant"""
     
@@ -147,7 +192,7 @@ Always use tools when users ask for specific information or actions related to K
             # Add message history
             self.agent_with_history = RunnableWithMessageHistory(
                 self.agent_executor,
-                lambda session_id: self.chat_history,
+                self._get_session_history,
                 input_messages_key="input",
                 history_messages_key="chat_history"
             )
@@ -157,6 +202,13 @@ Always use tools when users ask for specific information or actions related to K
         except Exception as e:
             print(f"⚠️ Failed to initialize agent: {e}")
     
+    def _get_session_history(self, session_id: str):
+        """Chat history for the agent, trimmed to the last MAX_CONTEXT_TURNS turns"""
+        messages = self.chat_history.messages
+        if len(messages) > MAX_CONTEXT_TURNS * 2:
+            self.chat_history.messages = messages[-MAX_CONTEXT_TURNS * 2:]
+        return self.chat_history
+    
     def chat(self, message: str) -> str:
         """Process a chat message and return AI response"""
         
@@ -175,76 +227,114 @@ Always use tools when users ask for specific information or actions related to K
         # Fallback to rule-based responses
         return self._fallback_response(message)
     
+    def stream(self, message: str) -> Iterator[str]:
+        """
+        Process a chat message, yielding the AI response in pieces as they become available
+        
+        The agent executor streams steps, not tokens: each tool call yields a
+        progress line as it starts, then the final answer arrives in one piece.
+        """
+        
+        # If LangChain agent is available, use it
+        if self.agent_with_history and self.llm:
+            try:
+                for chunk in self.agent_with_history.stream(
+                    {"input": message},
+                    config={"configurable": {"session_id": self.session_id}}
+                ):
+                    for action in chunk.get("actions", ()):
+                        yield TOOL_PROGRESS_TEMPLATE.format(tool=action.tool)
+                    if "output" in chunk:
+                        yield chunk["output"]
+                return
+                
+            except Exception as e:
+                yield f"❌ Agent error: {str(e)}\n\nFalling back to basic responses..."
+                return
+        
+        # Fallback to rule-based responses
+        yield self._fallback_response(message)
+    
     def _fallback_response(self, message: str) -> str:
         """Fallback response system when LangChain is not available"""
         
         message_lower = message.lower()
         
-        if any(word in message_lower for word in ['hello', 'hi', 'hey']):
-            return """👋 Hello! I'm KubeGenie, your AI Kubernetes Assistant.
-
-**Current Status:** 
-- 🤖 Chat: ✅ Active (Fallback mode)
-- 🔗 Kubernetes: ✅ Available
-
-**I can help you with:**
-- Connect to cluster
-- Show cluster status  
-- List nodes, pods, namespaces
-- Basic Kubernetes operations
-
-Try asking me about your cluster!"""
-
-        elif 'connect' in message_lower and 'cluster' in message_lower:
-            if self.k8s_ops:
-                return self.k8s_ops.connect_to_cluster()
-            else:
-                return "❌ Kubernetes operations not available"
-        
-        elif 'status' in message_lower or ('cluster' in message_lower and 'overview' in message_lower):
-            if self.k8s_ops and self.k8s_ops.is_connected():
-                return self.k8s_ops.get_cluster_overview()
-            else:
-                return "❌ Not connected to cluster. Please connect first with: 'Connect to cluster'"
-        
-        elif 'nodes' in message_lower or 'list nodes' in message_lower:
-            if self.k8s_ops and self.k8s_ops.is_connected():
-                return self.k8s_ops.list_cluster_nodes()
-            else:
-                return "❌ Not connected to cluster. Please connect first with: 'Connect to cluster'"
+        # Command-style messages ("pods in default", "status") are routed on their first word
+        words = message_lower.split(maxsplit=1)
+        handler = self._FIRST_WORD_ROUTES.get(words[0]) if words else None
+        if handler:
+            return handler(self, message_lower)
         
-        elif 'pods' in message_lower:
-            if self.k8s_ops and self.k8s_ops.is_connected():
-                # Check if specific namespace mentioned
-                if 'kube-system' in message_lower:
-                    return self.k8s_ops.list_pods_in_namespace('kube-system')
-                elif 'default' in message_lower:
-                    return self.k8s_ops.list_pods_in_namespace('default')
-                elif 'all' in message_lower:
-                    return self.k8s_ops.list_all_pods()  # All namespaces
-                else:
-                    return self.k8s_ops.list_all_pods()  # All namespaces by default
-            else:
-                return "❌ Not connected to cluster. Please connect first with: 'Connect to cluster'"
+        for pattern, handler in self._FALLBACK_ROUTES:
+            if pattern.search(message_lower):
+                return handler(self, message_lower)
         
-        elif 'namespaces' in message_lower or 'namespace' in message_lower:
-            if self.k8s_ops and self.k8s_ops.is_connected():
-                return self.k8s_ops.list_namespaces()
+        return f'🤖 I understand you said: "{message}"\n\n{COMMANDS_HELP_TEXT}'
+    
+    def _greeting_reply(self, message_lower: str) -> str:
+        """Greeting with a summary of what the fallback mode can do"""
+        return GREETING_TEXT
+    
+    def _connect_reply(self, message_lower: str) -> str:
+        """Connect to the cluster from the default kubeconfig"""
+        if self.k8s_ops:
+            return self.k8s_ops.connect_to_cluster()
+        else:
+            return "❌ Kubernetes operations not available"
+    
+    def _status_reply(self, message_lower: str) -> str:
+        """Cluster overview"""
+        if self.k8s_ops and self.k8s_ops.is_connected():
+            return self.k8s_ops.get_cluster_overview()
+        else:
+            return NOT_CONNECTED_MESSAGE
+    
+    def _nodes_reply(self, message_lower: str) -> str:
+        """List cluster nodes"""
+        if self.k8s_ops and self.k8s_ops.is_connected():
+            return self.k8s_ops.list_cluster_nodes()
+        else:
+            return NOT_CONNECTED_MESSAGE
+    
+    def _pods_reply(self, message_lower: str) -> str:
+        """List pods in the namespace mentioned, or across all namespaces"""
+        if self.k8s_ops and self.k8s_ops.is_connected():
+            # Check if specific namespace mentioned
+            namespace_match = _POD_NAMESPACE_RE.search(message_lower)
+            if namespace_match:
+                return self.k8s_ops.list_pods_in_namespace(namespace_match.group(1))
             else:
-                return "❌ Not connected to cluster. Please connect first with: 'Connect to cluster'"
-        
+                return self.k8s_ops.list_all_pods()  # All namespaces by default
         else:
-            return f"""🤖 I understand you said: "{message}"
-
-**Available Commands:**
-- "Connect to cluster" - Connect to your Kubernetes cluster
-- "Show cluster status" - Get cluster overview
-- "List nodes" - Show all cluster nodes
-- "Show pods" or "List pods" - Show all pods
-- "Show pods in kube-system" - Pods in specific namespace
-- "List namespaces" - Show all namespaces
-
-**💡 Tip:** Even without OpenAI, I can perform all Kubernetes operations!"""
+            return NOT_CONNECTED_MESSAGE
+    
+    def _namespaces_reply(self, message_lower: str) -> str:
+        """List cluster namespaces"""
+        if self.k8s_ops and self.k8s_ops.is_connected():
+            return self.k8s_ops.list_namespaces()
+        else:
+            return NOT_CONNECTED_MESSAGE
+    
+    # Fallback intents in priority order; the first matching pattern wins
+    _FALLBACK_ROUTES = (
+        (_GREETING_RE, _greeting_reply),
+        (_CONNECT_RE, _connect_reply),
+        (_STATUS_RE, _status_reply),
+        (_NODES_RE, _nodes_reply),
+        (_PODS_RE, _pods_reply),
+        (_NAMESPACES_RE, _namespaces_reply),
+    )
+    
+    _FIRST_WORD_ROUTES = {
+        "hello": _greeting_reply,
+        "hi": _greeting_reply,
+        "hey": _greeting_reply,
+        "status": _status_reply,
+        "nodes": _nodes_reply,
+        "pods": _pods_reply,
+        "namespaces": _namespaces_reply,
+    }
     
     def get_connection_status(self) -> Dict[str, Any]:
         """Get detailed status of all components"""
@@ -4,6 +4,7 @@ Handles environment variables and application settings
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 
@@ -35,10 +36,7 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings"""
-    return settings
\ No newline at end of file
+    """Get application settings (loaded from the environment on first use)"""
+    return Settings()
\ No newline at end of file
@@ -6,15 +6,80 @@ Step 3: Kubernetes client setup with kubeconfig support
 """
 
 import os
+import time
+import threading
 import yaml
-from typing import Dict, List, Optional, Any, Tuple
-from kubernetes import client, config
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 
+# Faster JSON decoding for raw list responses when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-@dataclass
+
+# How long a computed cluster status stays fresh before the API server is queried again
+STATUS_CACHE_TTL = 10.0
+
+# Server-side timeout for a single watch request; the watch resumes from the last seen version
+WATCH_TIMEOUT_SECONDS = 300
+
+# Extra seconds the client waits past WATCH_TIMEOUT_SECONDS before dropping a silent watch connection
+WATCH_CLIENT_TIMEOUT_MARGIN = 30
+
+# Delay before re-listing after a watch failure
+WATCH_RETRY_DELAY = 5.0
+
+# Serve list calls from the API server's watch cache instead of a quorum read from etcd.
+# Results may be slightly stale, which is fine for status and listing.
+CACHED_RESOURCE_VERSION = "0"
+CACHED_RESOURCE_VERSION_MATCH = "NotOlderThan"
+
+# Worker threads for blocking API calls issued concurrently. Kept small so
+# parallel requests cannot stampede the API server.
+EXECUTOR_MAX_WORKERS = 6
+
+# HTTP connection pool size for the API client (the library default of 4 is
+# easily exhausted by the watch threads plus concurrent tool calls)
+CONNECTION_POOL_MAXSIZE = 50
+
+# Shared stand-in for absent optional lists (e.g. container_statuses on a pending pod)
+_EMPTY: tuple = ()
+
+# Parsed kubeconfig contexts are reused while the file is unchanged, for at most this long
+KUBECONFIG_CACHE_MAX_AGE = 60.0
+
+# How long a probed server version is trusted when reconnecting to the same context
+VERSION_CACHE_TTL = 60.0
+
+# How long list_nodes/list_pods/list_namespaces results are reused
+RESOURCE_CACHE_TTL = 5.0
+
+# Message prefix of a successful result served from the last good list after a refresh failed
+STALE_MESSAGE_PREFIX = "⚠️ Showing cached data"
+
+# Pod status shown by get_cluster_status when the pod count failed, instead of a made-up 0/0
+PODS_UNAVAILABLE_STATUS = "⚠️ Unavailable"
+
+# Page size for pod lists, so a large cluster is not decoded in one response
+LIST_CHUNK_SIZE = 500
+
+# Label prefix that marks a node role, e.g. node-role.kubernetes.io/control-plane
+ROLE_PREFIX = "node-role.kubernetes.io/"
+
+# Ask the API server for metadata only (no spec/status) on list calls
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+
+@dataclass(slots=True, frozen=True)
 class ClusterInfo:
     """Information about a Kubernetes cluster"""
     name: str
@@ -26,7 +91,7 @@ class ClusterInfo:
     context: str
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class PodInfo:
     """Information about a Kubernetes pod"""
     name: str
@@ -38,7 +103,7 @@ class PodInfo:
     node: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeInfo:
     """Information about a Kubernetes node"""
     name: str
@@ -50,16 +115,233 @@ class NodeInfo:
     os_image: str
 
 
+@dataclass(slots=True, frozen=True)
+class _PodRecord:
+    """The pod fields PodInfo is built from; what the pod watch cache keeps per pod"""
+    name: str
+    namespace: str
+    phase: str
+    ready: str
+    restarts: int
+    node: str
+    created: Optional[str]
+
+
+def _pod_record(pod: Dict[str, Any]) -> _PodRecord:
+    """Reduce a decoded pod object to a _PodRecord"""
+    metadata = pod["metadata"]
+    spec = pod.get("spec", {})
+    status = pod.get("status", {})
+    
+    # Ready containers and restarts in a single pass
+    ready_containers = restart_count = 0
+    for cs in status.get("containerStatuses") or _EMPTY:
+        ready_containers += cs.get("ready", False)
+        restart_count += cs.get("restartCount", 0)
+    
+    return _PodRecord(
+        name=metadata["name"],
+        namespace=metadata["namespace"],
+        phase=status.get("phase", "Unknown"),
+        ready=f"{ready_containers}/{len(spec.get('containers') or _EMPTY)}",
+        restarts=restart_count,
+        node=spec.get("nodeName") or "Unknown",
+        created=metadata.get("creationTimestamp")
+    )
+
+
+class _ResourceCache:
+    """
+    Short-lived cache of list results keyed by method and arguments
+    
+    Interactive sessions tend to ask for status, nodes and pods in quick
+    succession; entries younger than the TTL are returned without another
+    round trip to the API server. Expired entries are kept so a failed
+    refresh can fall back to the last good result.
+    """
+    
+    def __init__(self, ttl: float = RESOURCE_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return the cached value for key if it is still fresh"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+    
+    def get_stale(self, key: Tuple) -> Optional[Any]:
+        """Return the last stored value for key regardless of age"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return entry[1] if entry else None
+    
+    def put(self, key: Tuple, value: Any):
+        """Store a value for key"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+    
+    def clear(self):
+        """Drop every entry (e.g. after switching clusters)"""
+        with self._lock:
+            self._entries.clear()
+
+
+class _ResourceWatcher:
+    """
+    Informer-style local cache for a Kubernetes list endpoint
+    
+    Performs one full list, then follows the watch stream in a background
+    thread and applies ADDED/MODIFIED/DELETED events to an in-memory map.
+    Objects are kept as decoded JSON dicts rather than client models, or as
+    whatever transform reduces them to.
+    Readers should fall back to a direct list call while not synced.
+    """
+    
+    def __init__(
+        self,
+        list_func: Callable,
+        key_func: Callable[[Any], str],
+        name: str,
+        transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        **list_kwargs: Any
+    ):
+        self._list_func = list_func
+        self._list_kwargs = list_kwargs
+        self._key_func = key_func
+        self._transform = transform or (lambda obj: obj)
+        self._name = name
+        self._items: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._thread = None
+    
+    @property
+    def synced(self) -> bool:
+        """True once the initial list has been loaded and the watch is healthy"""
+        return self._synced.is_set()
+    
+    def start(self):
+        """Start following the resource in a daemon thread"""
+        self._thread = threading.Thread(target=self._run, name=f"k8s-watch-{self._name}", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the watch; the cache is no longer considered synced"""
+        self._stopped.set()
+        self._synced.clear()
+        if self._watch:
+            self._watch.stop()
+    
+    def items(self) -> List[Any]:
+        """Snapshot of all cached objects"""
+        with self._lock:
+            return list(self._items.values())
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+    
+    def _run(self):
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                resource_version = self._follow(resource_version)
+            except ApiException as e:
+                # 410 Gone means our resource version was compacted away; relist
+                resource_version = None
+                if e.status != 410:
+                    self._synced.clear()
+                    self._stopped.wait(WATCH_RETRY_DELAY)
+            except Exception:
+                resource_version = None
+                self._synced.clear()
+                self._stopped.wait(WATCH_RETRY_DELAY)
+    
+    def _relist(self) -> str:
+        response = json_loads(self._list_func(
+            resource_version=CACHED_RESOURCE_VERSION,
+            resource_version_match=CACHED_RESOURCE_VERSION_MATCH,
+            _preload_content=False,
+            **self._list_kwargs
+        ).data)
+        key_func, transform = self._key_func, self._transform
+        items = {key_func(obj): transform(obj) for obj in response["items"]}
+        with self._lock:
+            self._items = items
+        self._synced.set()
+        return response["metadata"]["resourceVersion"]
+    
+    def _follow(self, resource_version: str) -> Optional[str]:
+        """Apply watch events until the server closes the stream; returns the version to resume from"""
+        self._watch = watch.Watch()
+        for event in self._watch.stream(
+            self._list_func,
+            resource_version=resource_version,
+            timeout_seconds=WATCH_TIMEOUT_SECONDS,
+            _request_timeout=WATCH_TIMEOUT_SECONDS + WATCH_CLIENT_TIMEOUT_MARGIN,
+            **self._list_kwargs
+        ):
+            if self._stopped.is_set():
+                break
+            
+            event_type = event["type"]
+            if event_type == "ERROR":
+                return None
+            
+            obj = event["raw_object"]
+            key = self._key_func(obj)
+            with self._lock:
+                if event_type == "DELETED":
+                    self._items.pop(key, None)
+                else:
+                    self._items[key] = self._transform(obj)
+        
+        return self._watch.resource_version or resource_version
+
+
 class KubernetesClient:
     """Main Kubernetes client for cluster operations"""
     
     def __init__(self):
+        self.api_client = None
         self.core_v1 = None
         self.apps_v1 = None
         self.current_context = None
         self.cluster_info = None
         self._connected = False
         
+        # Per-context status cache: context -> (timestamp, status)
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._status_locks: Dict[str, threading.Lock] = {}
+        self._status_locks_guard = threading.Lock()
+        
+        # Dedicated pool for blocking SDK calls; created on first use and
+        # again after close(), since the client is shared process-wide
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # Recent list results, including the node/namespace snapshot shared
+        # by connect() and get_cluster_status()
+        self._resource_cache = _ResourceCache()
+        
+        # Server version per (context, server): (timestamp, "major.minor"); kept across reconnects
+        self._version_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        
+        # Watch-backed caches, started on first use after connecting: nodes
+        # by the first node listing, pods by the first list_pods call
+        self._node_watcher: Optional[_ResourceWatcher] = None
+        self._pod_watcher: Optional[_ResourceWatcher] = None
+        self._pod_watcher_namespace: Optional[str] = None
+        self._watchers_lock = threading.Lock()
+        
     def connect(self, kubeconfig_path: Optional[str] = None, context: Optional[str] = None) -> Tuple[bool, str]:
         """
         Connect to a Kubernetes cluster
@@ -72,40 +354,54 @@ class KubernetesClient:
             Tuple of (success: bool, message: str)
         """
         try:
-            # Load kubeconfig
+            # Load kubeconfig into a dedicated configuration
+            configuration = self._build_configuration()
             if kubeconfig_path:
-                config.load_kube_config(config_file=kubeconfig_path, context=context)
+                config.load_kube_config(
+                    config_file=kubeconfig_path,
+                    context=context,
+                    client_configuration=configuration
+                )
             else:
                 # Try in-cluster config first, then default kubeconfig
                 try:
-                    config.load_incluster_config()
+                    config.load_incluster_config(client_configuration=configuration)
                 except config.ConfigException:
-                    config.load_kube_config(context=context)
+                    config.load_kube_config(context=context, client_configuration=configuration)
             
-            # Initialize API clients
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
+            # Drop state built against a previous connection
+            self._connected = False
+            self._stop_watchers()
+            self._status_cache.clear()
+            self._resource_cache.clear()
+            if self.api_client:
+                self.api_client.close()
+            
+            # Initialize API clients on one shared, thread-safe ApiClient
+            self.api_client = client.ApiClient(configuration=configuration)
+            # List responses compress well; urllib3 decodes them transparently
+            self.api_client.set_default_header("Accept-Encoding", "gzip")
+            self.core_v1 = client.CoreV1Api(self.api_client)
+            self.apps_v1 = client.AppsV1Api(self.api_client)
             
             # Get current context
-            contexts, active_context = config.list_kube_config_contexts()
+            contexts, active_context = _list_contexts()
             self.current_context = active_context['name'] if active_context else "unknown"
             
-            # Test connection and get cluster info
-            version_api = client.VersionApi()
-            version_info = version_api.get_code()
-            nodes = self.core_v1.list_node()
-            namespaces = self.core_v1.list_namespace()
+            # Test connection and get cluster info; the node/namespace snapshot
+            # stays cached for the list_* and status calls that usually follow
+            version = self._server_version()
+            snapshot = self._snapshot(include_pods=False)
             
             # Get cluster server info
-            configuration = client.Configuration().get_default_copy()
-            server_url = configuration.host
+            server_url = self.api_client.configuration.host
             
             self.cluster_info = ClusterInfo(
                 name=self.current_context,
                 server=server_url,
-                version=f"{version_info.major}.{version_info.minor}",
-                nodes=len(nodes.items),
-                namespaces=len(namespaces.items),
+                version=version,
+                nodes=len(snapshot["nodes"]),
+                namespaces=len(snapshot["namespaces"]),
                 connected=True,
                 context=self.current_context
             )
@@ -114,9 +410,127 @@ class KubernetesClient:
             return True, f"✅ Connected to cluster '{self.current_context}' (v{self.cluster_info.version})"
             
         except Exception as e:
+            self._stop_watchers()
             self._connected = False
             return False, f"❌ Connection failed: {str(e)}"
     
+    def _server_version(self) -> str:
+        """Server version as "major.minor", probed at most once per VERSION_CACHE_TTL per context"""
+        key = (self.current_context, self.api_client.configuration.host)
+        entry = self._version_cache.get(key)
+        if entry and time.monotonic() - entry[0] < VERSION_CACHE_TTL:
+            return entry[1]
+        
+        version_info = client.VersionApi(self.api_client).get_code()
+        version = f"{version_info.major}.{version_info.minor}"
+        self._version_cache[key] = (time.monotonic(), version)
+        return version
+    
+    @staticmethod
+    def _build_configuration() -> client.Configuration:
+        """Create an API configuration with a larger pool and retry on transient errors"""
+        configuration = client.Configuration()
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        configuration.retries = Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=(500, 502, 503, 504)
+        )
+        return configuration
+    
+    def _ensure_node_watcher(self):
+        """Start the node watch cache if connected and it is not running yet"""
+        with self._watchers_lock:
+            if self._node_watcher is None and self._connected:
+                self._node_watcher = _ResourceWatcher(
+                    self.core_v1.list_node,
+                    lambda node: node["metadata"]["name"],
+                    "nodes"
+                )
+                self._node_watcher.start()
+    
+    def _ensure_pod_watcher(self):
+        """Start the all-namespaces pod watch cache if connected and no pod cache is running yet"""
+        with self._watchers_lock:
+            if self._pod_watcher is None and self._connected:
+                self._start_pod_watcher(None)
+    
+    def start_pod_informer(self, namespace: Optional[str] = None):
+        """
+        (Re)start the watch-backed pod cache
+        
+        Once synced, list_pods and pod counts covered by the cache are served
+        from memory without contacting the API server. Only the fields in
+        _PodRecord are kept per pod.
+        
+        Args:
+            namespace: Only watch this namespace (default: all namespaces)
+        """
+        with self._watchers_lock:
+            self._start_pod_watcher(namespace)
+    
+    def _start_pod_watcher(self, namespace: Optional[str]):
+        """Replace the pod watch cache; the caller holds _watchers_lock"""
+        if self._pod_watcher:
+            self._pod_watcher.stop()
+        
+        if namespace:
+            watcher = _ResourceWatcher(
+                self.core_v1.list_namespaced_pod,
+                lambda pod: pod["metadata"]["uid"],
+                f"pods-{namespace}",
+                transform=_pod_record,
+                namespace=namespace
+            )
+        else:
+            watcher = _ResourceWatcher(
+                self.core_v1.list_pod_for_all_namespaces,
+                lambda pod: pod["metadata"]["uid"],
+                "pods",
+                transform=_pod_record
+            )
+        self._pod_watcher = watcher
+        self._pod_watcher_namespace = namespace
+        watcher.start()
+    
+    def _pod_cache_covers(self, namespace: Optional[str] = None) -> bool:
+        """True if the pod watch cache is synced and includes the namespace (None: all)"""
+        if not (self._pod_watcher and self._pod_watcher.synced):
+            return False
+        return self._pod_watcher_namespace is None or self._pod_watcher_namespace == namespace
+    
+    def _stop_watchers(self):
+        """Stop any running informer caches"""
+        with self._watchers_lock:
+            for watcher in (self._node_watcher, self._pod_watcher):
+                if watcher:
+                    watcher.stop()
+            self._node_watcher = None
+            self._pod_watcher = None
+            self._pod_watcher_namespace = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool, creating it if this is the first use since close()"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="k8s-client"
+                )
+            return self._executor
+    
+    def close(self):
+        """Stop background watches and release worker threads and connections"""
+        self._stop_watchers()
+        with self._executor_lock:
+            if self._executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+        if self.api_client:
+            self.api_client.close()
+            self.api_client = None
+        self._connected = False
+    
     def is_connected(self) -> bool:
         """Check if client is connected to a cluster"""
         return self._connected
@@ -125,76 +539,92 @@ class KubernetesClient:
         """Get current cluster information"""
         return self.cluster_info
     
-    def list_nodes(self) -> Tuple[bool, List[NodeInfo], str]:
+    def list_nodes(self, force_refresh: bool = False) -> Tuple[bool, List[NodeInfo], str]:
         """
         List all nodes in the cluster
         
+        Args:
+            force_refresh: Bypass the short-lived result cache
+        
         Returns:
             Tuple of (success: bool, nodes: List[NodeInfo], message: str)
         """
         if not self.is_connected():
             return False, [], "❌ Not connected to cluster"
         
+        cache_key = ("nodes",)
+        if not force_refresh:
+            cached = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            nodes_response = self.core_v1.list_node()
-            nodes = []
+            snapshot = None if force_refresh else self._resource_cache.get(("snapshot",))
+            node_items = snapshot["nodes"] if snapshot else self._node_items()
+            now = datetime.now(timezone.utc)
+            nodes = [self._to_node_info(node, now) for node in node_items]
             
-            for node in nodes_response.items:
-                # Get node status
-                status = "Unknown"
-                for condition in node.status.conditions:
-                    if condition.type == "Ready":
-                        status = "Ready" if condition.status == "True" else "NotReady"
-                        break
-                
-                # Get node roles
-                roles = []
-                if node.metadata.labels:
-                    for label, value in node.metadata.labels.items():
-                        if label.startswith("node-role.kubernetes.io/"):
-                            role = label.split("/")[-1]
-                            if role:
-                                roles.append(role)
-                
-                if not roles:
-                    roles = ["worker"]
-                
-                # Get internal IP
-                internal_ip = "Unknown"
-                if node.status.addresses:
-                    for address in node.status.addresses:
-                        if address.type == "InternalIP":
-                            internal_ip = address.address
-                            break
-                
-                # Calculate age
-                age = self._calculate_age(node.metadata.creation_timestamp)
-                
-                node_info = NodeInfo(
-                    name=node.metadata.name,
-                    status=status,
-                    roles=roles,
-                    age=age,
-                    version=node.status.node_info.kubelet_version,
-                    internal_ip=internal_ip,
-                    os_image=node.status.node_info.os_image
-                )
-                nodes.append(node_info)
-            
-            return True, nodes, f"✅ Found {len(nodes)} nodes"
+            result = True, nodes, f"✅ Found {len(nodes)} nodes"
+            self._resource_cache.put(cache_key, result)
+            return result
             
         except ApiException as e:
-            return False, [], f"❌ API error: {e.reason}"
+            return self._stale_or_error(cache_key, f"❌ API error: {e.reason}")
         except Exception as e:
-            return False, [], f"❌ Error listing nodes: {str(e)}"
+            return self._stale_or_error(cache_key, f"❌ Error listing nodes: {str(e)}")
     
-    def list_pods(self, namespace: str = "default", all_namespaces: bool = False) -> Tuple[bool, List[PodInfo], str]:
+    def _to_node_info(self, node: Dict[str, Any], now: datetime) -> NodeInfo:
+        """Convert a decoded node object into NodeInfo"""
+        metadata = node["metadata"]
+        node_status = node.get("status", {})
+        node_info = node_status.get("nodeInfo", {})
+        
+        # Get node status
+        status = self._node_status(node)
+        
+        # Get node roles
+        roles = [
+            label.rpartition("/")[2]
+            for label in metadata.get("labels") or _EMPTY
+            if label.startswith(ROLE_PREFIX) and label != ROLE_PREFIX
+        ] or ["worker"]
+        
+        # Get internal IP
+        internal_ip = next(
+            (
+                address["address"]
+                for address in node_status.get("addresses") or _EMPTY
+                if address["type"] == "InternalIP"
+            ),
+            "Unknown"
+        )
+        
+        # Calculate age
+        age = self._calculate_age(now, metadata.get("creationTimestamp"))
+        
+        return NodeInfo(
+            name=metadata["name"],
+            status=status,
+            roles=roles,
+            age=age,
+            version=node_info.get("kubeletVersion", "Unknown"),
+            internal_ip=internal_ip,
+            os_image=node_info.get("osImage", "Unknown")
+        )
+    
+    def list_pods(
+        self,
+        namespace: str = "default",
+        all_namespaces: bool = False,
+        force_refresh: bool = False
+    ) -> Tuple[bool, List[PodInfo], str]:
         """
         List pods in a namespace or all namespaces
         
         Args:
             namespace: Namespace to list pods from
             all_namespaces: If True, list pods from all namespaces
+            force_refresh: Bypass the short-lived result cache
             
         Returns:
             Tuple of (success: bool, pods: List[PodInfo], message: str)
@@ -202,100 +632,207 @@ class KubernetesClient:
         if not self.is_connected():
             return False, [], "❌ Not connected to cluster"
         
+        cache_key = ("pods", None if all_namespaces else namespace)
+        if not force_refresh:
+            cached = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            if all_namespaces:
-                pods_response = self.core_v1.list_pod_for_all_namespaces()
+            # Serve from the watch cache when it is in sync; this call lists
+            # directly while the cache starts
+            self._ensure_pod_watcher()
+            if self._pod_cache_covers(None if all_namespaces else namespace):
+                records = self._pod_watcher.items()
+                if not all_namespaces:
+                    records = [record for record in records if record.namespace == namespace]
+                # Watch events arrive in any order; match the API's namespace/name order
+                records.sort(key=lambda record: (record.namespace, record.name))
             else:
-                pods_response = self.core_v1.list_namespaced_pod(namespace=namespace)
+                records = map(_pod_record, self._iter_pods(None if all_namespaces else namespace))
             
-            pods = []
-            
-            for pod in pods_response.items:
-                # Calculate ready containers
-                ready_containers = 0
-                total_containers = len(pod.spec.containers)
-                
-                if pod.status.container_statuses:
-                    for container_status in pod.status.container_statuses:
-                        if container_status.ready:
-                            ready_containers += 1
-                
-                ready_str = f"{ready_containers}/{total_containers}"
-                
-                # Calculate restart count
-                restart_count = 0
-                if pod.status.container_statuses:
-                    for container_status in pod.status.container_statuses:
-                        restart_count += container_status.restart_count
-                
-                # Calculate age
-                age = self._calculate_age(pod.metadata.creation_timestamp)
-                
-                pod_info = PodInfo(
-                    name=pod.metadata.name,
-                    namespace=pod.metadata.namespace,
-                    status=pod.status.phase,
-                    ready=ready_str,
-                    restarts=restart_count,
-                    age=age,
-                    node=pod.spec.node_name or "Unknown"
-                )
-                pods.append(pod_info)
+            now = datetime.now(timezone.utc)
+            pods = [self._to_pod_info(record, now) for record in records]
             
             namespace_msg = "all namespaces" if all_namespaces else f"namespace '{namespace}'"
-            return True, pods, f"✅ Found {len(pods)} pods in {namespace_msg}"
+            result = True, pods, f"✅ Found {len(pods)} pods in {namespace_msg}"
+            self._resource_cache.put(cache_key, result)
+            return result
             
         except ApiException as e:
-            return False, [], f"❌ API error: {e.reason}"
+            return self._stale_or_error(cache_key, f"❌ API error: {e.reason}")
         except Exception as e:
-            return False, [], f"❌ Error listing pods: {str(e)}"
+            return self._stale_or_error(cache_key, f"❌ Error listing pods: {str(e)}")
     
-    def list_namespaces(self) -> Tuple[bool, List[str], str]:
+    def _iter_pods(self, namespace: Optional[str] = None, chunk: int = LIST_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Yield decoded pod objects one page at a time
+        
+        Args:
+            namespace: Namespace to list (default: all namespaces)
+            chunk: Maximum number of pods per request
+        """
+        if namespace:
+            list_func = self.core_v1.list_namespaced_pod
+            list_kwargs = {"namespace": namespace}
+        else:
+            list_func = self.core_v1.list_pod_for_all_namespaces
+            list_kwargs = {}
+        
+        # Only the first page may come from the watch cache; continuation
+        # pages are pinned by the token instead
+        page_kwargs = {
+            "resource_version": CACHED_RESOURCE_VERSION,
+            "resource_version_match": CACHED_RESOURCE_VERSION_MATCH
+        }
+        while True:
+            page = json_loads(list_func(
+                limit=chunk,
+                _preload_content=False,
+                **list_kwargs,
+                **page_kwargs
+            ).data)
+            yield from page["items"]
+            
+            token = page["metadata"].get("continue")
+            if not token:
+                return
+            page_kwargs = {"_continue": token}
+    
+    def _stale_or_error(self, cache_key: Tuple, error_message: str) -> Tuple[bool, List[Any], str]:
+        """
+        Fall back to the last good result for cache_key when a refresh fails
+        
+        The message then starts with STALE_MESSAGE_PREFIX, so callers can tell
+        the data is stale even though success is True.
+        """
+        stale = self._resource_cache.get_stale(cache_key)
+        if stale is None:
+            return False, [], error_message
+        success, items, _ = stale
+        return success, items, f"{STALE_MESSAGE_PREFIX}, refresh failed: {error_message}"
+    
+    def _to_pod_info(self, record: _PodRecord, now: datetime) -> PodInfo:
+        """Convert a _PodRecord into PodInfo"""
+        return PodInfo(
+            name=record.name,
+            namespace=record.namespace,
+            status=record.phase,
+            ready=record.ready,
+            restarts=record.restarts,
+            age=self._calculate_age(now, record.created),
+            node=record.node
+        )
+    
+    def list_namespaces(self, force_refresh: bool = False) -> Tuple[bool, List[str], str]:
         """
         List all namespaces in the cluster
         
+        Args:
+            force_refresh: Bypass the short-lived result cache
+        
         Returns:
             Tuple of (success: bool, namespaces: List[str], message: str)
         """
         if not self.is_connected():
             return False, [], "❌ Not connected to cluster"
         
+        cache_key = ("namespaces",)
+        if not force_refresh:
+            cached = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            namespaces_response = self.core_v1.list_namespace()
-            namespaces = [ns.metadata.name for ns in namespaces_response.items]
-            namespaces.sort()
+            snapshot = None if force_refresh else self._resource_cache.get(("snapshot",))
+            namespaces = snapshot["namespaces"] if snapshot else self._namespace_names()
             
-            return True, namespaces, f"✅ Found {len(namespaces)} namespaces"
+            result = True, namespaces, f"✅ Found {len(namespaces)} namespaces"
+            self._resource_cache.put(cache_key, result)
+            return result
             
         except ApiException as e:
-            return False, [], f"❌ API error: {e.reason}"
+            return self._stale_or_error(cache_key, f"❌ API error: {e.reason}")
         except Exception as e:
-            return False, [], f"❌ Error listing namespaces: {str(e)}"
+            return self._stale_or_error(cache_key, f"❌ Error listing namespaces: {str(e)}")
     
-    def get_cluster_status(self) -> Tuple[bool, Dict[str, Any], str]:
+    def get_cluster_status(self, force: bool = False) -> Tuple[bool, Dict[str, Any], str]:
         """
         Get comprehensive cluster status
         
+        Results are cached per context for STATUS_CACHE_TTL seconds, and
+        concurrent callers share a single refresh.
+        
+        Args:
+            force: Bypass the cache and query the API server
+            
         Returns:
             Tuple of (success: bool, status: Dict, message: str)
         """
         if not self.is_connected():
             return False, {}, "❌ Not connected to cluster"
         
+        key = self.current_context or "unknown"
+        if not force:
+            cached = self._get_cached_status(key)
+            if cached is not None:
+                return True, cached, "✅ Cluster status retrieved (cached)"
+        
+        with self._status_lock(key):
+            # Another caller may have refreshed while we waited on the lock
+            if not force:
+                cached = self._get_cached_status(key)
+                if cached is not None:
+                    return True, cached, "✅ Cluster status retrieved (cached)"
+            
+            success, status, message = self._fetch_cluster_status(force_refresh=force)
+            # A status missing its pod counts is not cached, so the next call retries
+            if success and status["pods"]["running"] is not None:
+                self._status_cache[key] = (time.monotonic(), status)
+            return success, status, message
+    
+    def _get_cached_status(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached status for a context if it is still fresh"""
+        entry = self._status_cache.get(key)
+        if entry and time.monotonic() - entry[0] < STATUS_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _status_lock(self, key: str) -> threading.Lock:
+        """Get the refresh lock for a context, creating it on first use"""
+        with self._status_locks_guard:
+            lock = self._status_locks.get(key)
+            if lock is None:
+                lock = self._status_locks[key] = threading.Lock()
+            return lock
+    
+    def _fetch_cluster_status(self, force_refresh: bool = False) -> Tuple[bool, Dict[str, Any], str]:
+        """Query the API server for node, pod and namespace status"""
         try:
+            snapshot = self._snapshot(force_refresh=force_refresh)
+            
             # Get nodes status
-            success_nodes, nodes, _ = self.list_nodes()
-            ready_nodes = len([n for n in nodes if n.status == "Ready"]) if success_nodes else 0
-            total_nodes = len(nodes) if success_nodes else 0
+            nodes = snapshot["nodes"]
+            ready_nodes = Counter(map(self._node_status, nodes))["Ready"]
+            total_nodes = len(nodes)
             
-            # Get pods status
-            success_pods, pods, _ = self.list_pods(all_namespaces=True)
-            running_pods = len([p for p in pods if p.status == "Running"]) if success_pods else 0
-            total_pods = len(pods) if success_pods else 0
+            # Get pods status; running/total are None when the count failed
+            if snapshot["pods"] is None:
+                pods_status = {
+                    "running": None,
+                    "total": None,
+                    "status": f"{PODS_UNAVAILABLE_STATUS} ({snapshot['pods_error']})"
+                }
+            else:
+                running_pods, total_pods = snapshot["pods"]
+                pods_status = {
+                    "running": running_pods,
+                    "total": total_pods,
+                    "status": f"{running_pods}/{total_pods} Running"
+                }
             
             # Get namespaces count
-            success_ns, namespaces, _ = self.list_namespaces()
-            namespace_count = len(namespaces) if success_ns else 0
+            namespace_count = len(snapshot["namespaces"])
             
             status = {
                 "cluster_name": self.cluster_info.name if self.cluster_info else "unknown",
@@ -305,11 +842,7 @@ class KubernetesClient:
                     "total": total_nodes,
                     "status": f"{ready_nodes}/{total_nodes} Ready"
                 },
-                "pods": {
-                    "running": running_pods,
-                    "total": total_pods,
-                    "status": f"{running_pods}/{total_pods} Running"
-                },
+                "pods": pods_status,
                 "namespaces": namespace_count,
                 "connected": True
             }
@@ -319,32 +852,216 @@ class KubernetesClient:
         except Exception as e:
             return False, {}, f"❌ Error getting cluster status: {str(e)}"
     
-    def _calculate_age(self, creation_timestamp) -> str:
-        """Calculate age string from creation timestamp"""
-        if not creation_timestamp:
-            return "Unknown"
+    def _snapshot(self, include_pods: bool = True, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Fetch the raw inputs shared by connect() and get_cluster_status()
         
-        now = datetime.now(creation_timestamp.tzinfo)
-        age = now - creation_timestamp
+        Node and namespace lists are kept in the resource cache, so a status
+        request right after connecting does not list them again.
         
-        days = age.days
-        hours = age.seconds // 3600
-        minutes = (age.seconds % 3600) // 60
+        Args:
+            include_pods: Also count running/total pods
+            force_refresh: Ignore a cached node/namespace snapshot
+            
+        Returns:
+            Dict with "nodes" (raw node objects), "namespaces" (sorted names)
+            and, if requested, "pods" as a (running, total) tuple, or None
+            with the reason in "pods_error" if counting failed
+        """
+        # The node, namespace and pod queries are independent, so issue them
+        # concurrently: wall-clock becomes the slowest call, not the sum
+        executor = self._get_executor()
+        pods_future = executor.submit(self._count_pods) if include_pods else None
         
-        if days > 0:
-            return f"{days}d"
-        elif hours > 0:
-            return f"{hours}h"
-        elif minutes > 0:
-            return f"{minutes}m"
+        cached = None if force_refresh else self._resource_cache.get(("snapshot",))
+        if cached is not None:
+            snapshot = dict(cached)
         else:
-            return "<1m"
+            nodes_future = executor.submit(self._node_items)
+            namespaces_future = executor.submit(self._namespace_names)
+            snapshot = {
+                "nodes": nodes_future.result(),
+                "namespaces": namespaces_future.result()
+            }
+            self._resource_cache.put(("snapshot",), dict(snapshot))
+        
+        if pods_future:
+            try:
+                snapshot["pods"] = pods_future.result()
+            except Exception as e:
+                snapshot["pods"] = None
+                snapshot["pods_error"] = str(e)
+        
+        return snapshot
+    
+    def _node_items(self) -> List[Dict[str, Any]]:
+        """Decoded node objects, served from the watch cache when it is in sync"""
+        self._ensure_node_watcher()
+        if self._node_watcher and self._node_watcher.synced:
+            # Watch events arrive in any order; match the API's name order
+            return sorted(self._node_watcher.items(), key=lambda node: node["metadata"]["name"])
+        return json_loads(self.core_v1.list_node(
+            resource_version=CACHED_RESOURCE_VERSION,
+            resource_version_match=CACHED_RESOURCE_VERSION_MATCH,
+            _preload_content=False
+        ).data)["items"]
+    
+    def _namespace_names(self) -> List[str]:
+        """Sorted namespace names from a metadata-only list"""
+        namespaces_response = self._list_metadata("/api/v1/namespaces")
+        return sorted(ns["metadata"]["name"] for ns in namespaces_response["items"])
+    
+    @staticmethod
+    def _node_status(node: Dict[str, Any]) -> str:
+        """Ready/NotReady from the node's Ready condition"""
+        conditions = node.get("status", {}).get("conditions") or _EMPTY
+        ready = next(
+            (c["status"] == "True" for c in conditions if c["type"] == "Ready"),
+            None
+        )
+        if ready is None:
+            return "Unknown"
+        return "Ready" if ready else "NotReady"
+    
+    def _count_pods(self) -> Tuple[int, int]:
+        """Count (running, total) pods without materializing full pod objects"""
+        if self._pod_cache_covers():
+            phases = self._pod_phases()
+            return phases.count("Running"), len(phases)
+        
+        return self.count_pods("Running"), self.count_pods()
+    
+    def _pod_phases(self) -> List[Optional[str]]:
+        """Phase of every watched pod as one flat list, for C-level counting"""
+        return [record.phase for record in self._pod_watcher.items()]
+    
+    def count_pods(self, phase: Optional[str] = None) -> int:
+        """
+        Count pods across all namespaces without listing them in full
+        
+        Args:
+            phase: Only count pods in this phase (e.g. "Running")
+            
+        Returns:
+            Number of matching pods
+        """
+        if self._pod_cache_covers():
+            phases = self._pod_phases()
+            return len(phases) if phase is None else phases.count(phase)
+        
+        if phase:
+            # remainingItemCount is not reported for field-selected lists,
+            # so count the metadata-only items instead
+            response = self._list_metadata("/api/v1/pods", fieldSelector=f"status.phase={phase}")
+            return len(response["items"])
+        
+        # A one-item page reports how many items remain. Paging needs a
+        # consistent read, so the watch-cache resource version is not used here.
+        response = self._list_metadata(
+            "/api/v1/pods",
+            limit="1",
+            resourceVersion=None,
+            resourceVersionMatch=None
+        )
+        return len(response["items"]) + (response["metadata"].get("remainingItemCount") or 0)
+    
+    def _list_metadata(self, path: str, **query: str) -> Dict[str, Any]:
+        """
+        List objects as a PartialObjectMetadataList
+        
+        Args:
+            path: API path of the collection, e.g. "/api/v1/pods"
+            **query: Extra query parameters such as fieldSelector; None omits a parameter
+            
+        Returns:
+            Decoded list response containing only object metadata
+        """
+        query.setdefault("resourceVersion", CACHED_RESOURCE_VERSION)
+        query.setdefault("resourceVersionMatch", CACHED_RESOURCE_VERSION_MATCH)
+        # Skip the client's model deserialization and decode the raw body directly
+        response = self.api_client.call_api(
+            path,
+            "GET",
+            query_params=[(key, value) for key, value in query.items() if value is not None],
+            header_params={"Accept": PARTIAL_METADATA_ACCEPT},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        return json_loads(response.data)
+    
+    @staticmethod
+    def _calculate_age(now: datetime, creation_timestamp: Optional[str]) -> str:
+        """
+        Calculate age string from an RFC 3339 creation timestamp
+        
+        Args:
+            now: Current UTC time, taken once per listing
+            creation_timestamp: Object creation timestamp
+        """
+        if not creation_timestamp:
+            return "Unknown"
+        
+        created = datetime.fromisoformat(creation_timestamp.replace("Z", "+00:00"))
+        return _format_age(int((now - created).total_seconds()) // 60)
+
+
+@lru_cache(maxsize=2048)
+def _format_age(minutes: int) -> str:
+    """Age string for a whole number of minutes (e.g. "3d", "5h", "12m")"""
+    if minutes >= 1440:
+        return f"{minutes // 1440}d"
+    elif minutes >= 60:
+        return f"{minutes // 60}h"
+    elif minutes > 0:
+        return f"{minutes}m"
+    else:
+        return "<1m"
+
+
+# (loaded_at, kubeconfig mtimes, contexts, active context)
+_contexts_cache: Optional[Tuple[float, Tuple, List[Dict[str, Any]], Optional[Dict[str, Any]]]] = None
+_contexts_cache_lock = threading.Lock()
+
+
+def _kubeconfig_mtimes() -> Tuple:
+    """Modification times of every file named by $KUBECONFIG (or ~/.kube/config)"""
+    paths = os.environ.get("KUBECONFIG", "~/.kube/config").split(os.pathsep)
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(os.path.expanduser(path)).st_mtime)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _list_contexts() -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Cached wrapper around config.list_kube_config_contexts
+    
+    The parsed YAML is reused while the kubeconfig files are unchanged and
+    the entry is younger than KUBECONFIG_CACHE_MAX_AGE.
+    """
+    global _contexts_cache
+    
+    mtimes = _kubeconfig_mtimes()
+    now = time.monotonic()
+    with _contexts_cache_lock:
+        cached = _contexts_cache
+    if cached and cached[1] == mtimes and now - cached[0] < KUBECONFIG_CACHE_MAX_AGE:
+        return cached[2], cached[3]
+    
+    contexts, active_context = config.list_kube_config_contexts()
+    with _contexts_cache_lock:
+        _contexts_cache = (now, mtimes, contexts, active_context)
+    return contexts, active_context
 
 
 def get_available_contexts() -> List[str]:
     """Get list of available kubectl contexts"""
     try:
-        contexts, active_context = config.list_kube_config_contexts()
+        contexts, active_context = _list_contexts()
         return [context['name'] for context in contexts]
     except Exception:
         return []
@@ -353,7 +1070,7 @@ def get_available_contexts() -> List[str]:
 def get_current_context() -> Optional[str]:
     """Get current kubectl context"""
     try:
-        contexts, active_context = config.list_kube_config_contexts()
+        contexts, active_context = _list_contexts()
         return active_context['name'] if active_context else None
     except Exception:
         return None
\ No newline at end of file
@@ -5,30 +5,63 @@ Provides user-friendly cluster management functions
 Step 3: Kubernetes operations with error handling and formatting
 """
 
+import atexit
+import threading
+from collections import Counter, defaultdict
+from itertools import islice
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
-from .k8s_client import KubernetesClient, ClusterInfo, PodInfo, NodeInfo
+from .k8s_client import KubernetesClient, ClusterInfo, PodInfo, NodeInfo, STALE_MESSAGE_PREFIX
+
+
+# Status icon per pod phase (read-only); anything else is shown as ⚪
+POD_STATUS_ICONS = MappingProxyType({
+    "Running": "🟢",
+    "Pending": "🟡",
+    "Failed": "🔴",
+    "Succeeded": "✅"
+})
+
+# Namespaces listed under "System Namespaces"
+SYSTEM_NAMESPACE_PREFIXES = ("kube-", "default")
+
+# Connection state shared by every KubernetesOperations instance. The lock
+# guards creating the client and serializes connect/disconnect.
+_client_lock = threading.Lock()
+_shared_client: Optional[KubernetesClient] = None
+_shared_connected = False
+
+
+def _stale_note(message: str) -> Tuple[str, ...]:
+    """The client message as a section of its own when the listed data is stale"""
+    return (message,) if message.startswith(STALE_MESSAGE_PREFIX) else ()
+
+
+def _get_shared_client() -> KubernetesClient:
+    """Get the process-wide KubernetesClient, creating it on first use"""
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None:
+            _shared_client = KubernetesClient()
+            # Close explicitly at exit rather than from a finalizer during teardown
+            atexit.register(_shared_client.close)
+        return _shared_client
 
 
 class KubernetesOperations:
     """High-level Kubernetes operations for KubeGenie"""
     
-    # Class-level shared connection state
-    _shared_client = None
-    _shared_connected = False
-    
     def __init__(self):
-        # Use shared client if available, otherwise create new one
-        if KubernetesOperations._shared_client is None:
-            KubernetesOperations._shared_client = KubernetesClient()
-        self.client = KubernetesOperations._shared_client
+        self.client = _get_shared_client()
         
     @property
     def _connected(self):
-        return KubernetesOperations._shared_connected
+        return _shared_connected
         
     @_connected.setter
     def _connected(self, value):
-        KubernetesOperations._shared_connected = value
+        global _shared_connected
+        _shared_connected = value
     
     def is_connected(self) -> bool:
         """Check if connected to cluster"""
@@ -45,8 +78,9 @@ class KubernetesOperations:
         Returns:
             Formatted status message
         """
-        success, message = self.client.connect(kubeconfig_path, context)
-        self._connected = success
+        with _client_lock:
+            success, message = self.client.connect(kubeconfig_path, context)
+            self._connected = success
         
         if success:
             cluster_info = self.client.get_cluster_info()
@@ -81,6 +115,9 @@ class KubernetesOperations:
         if not success:
             return f"❌ Failed to get cluster status: {message}"
         
+        pods = status['pods']
+        pods_summary = pods['status'] if pods['running'] is None else f"{pods['status']} ({pods['running']} running)"
+        
         return f"""📊 **Cluster Status Overview**
 
 **Cluster Information:**
@@ -89,7 +126,7 @@ class KubernetesOperations:
 
 **Resource Summary:**
 - 🖥️ Nodes: {status['nodes']['status']} ({status['nodes']['ready']} ready)
-- 🚀 Pods: {status['pods']['status']} ({status['pods']['running']} running)
+- 🚀 Pods: {pods_summary}
 - 📁 Namespaces: {status['namespaces']}
 
 **Health Status:** {'🟢 Healthy' if status['nodes']['ready'] > 0 else '🔴 Issues Detected'}"""
@@ -107,23 +144,21 @@ class KubernetesOperations:
         if not nodes:
             return "📋 No nodes found in cluster."
         
-        result = "🖥️ **Cluster Nodes**\n\n"
+        sections = ["🖥️ **Cluster Nodes**", *_stale_note(message)]
         
         for node in nodes:
             status_icon = "🟢" if node.status == "Ready" else "🔴"
             roles_str = ", ".join(node.roles)
             
-            result += f"""**{node.name}**
+            sections.append(f"""**{node.name}**
 - {status_icon} Status: `{node.status}`
 - 🏷️ Roles: `{roles_str}`
 - 🔢 Version: `{node.version}`
 - 🌐 IP: `{node.internal_ip}`
 - ⏰ Age: `{node.age}`
-- 💻 OS: `{node.os_image}`
-
-"""
+- 💻 OS: `{node.os_image}`""")
         
-        return result.strip()
+        return "\n\n".join(sections)
     
     def list_pods_in_namespace(self, namespace: str = "default") -> str:
         """List pods in a specific namespace"""
@@ -138,44 +173,38 @@ class KubernetesOperations:
         if not pods:
             return f"📋 No pods found in namespace `{namespace}`."
         
-        result = f"🚀 **Pods in Namespace `{namespace}`**\n\n"
-        
-        # Group pods by status
-        running_pods = [p for p in pods if p.status == "Running"]
-        pending_pods = [p for p in pods if p.status == "Pending"]
-        failed_pods = [p for p in pods if p.status == "Failed"]
-        other_pods = [p for p in pods if p.status not in ["Running", "Pending", "Failed"]]
+        # Count pods by status in a single pass
+        phases = Counter(p.status for p in pods)
+        running_count = phases["Running"]
+        pending_count = phases["Pending"]
+        failed_count = phases["Failed"]
+        other_count = len(pods) - running_count - pending_count - failed_count
         
         # Summary
-        result += f"**Summary:** {len(pods)} total pods\n"
-        result += f"- 🟢 Running: {len(running_pods)}\n"
-        result += f"- 🟡 Pending: {len(pending_pods)}\n"
-        result += f"- 🔴 Failed: {len(failed_pods)}\n"
-        if other_pods:
-            result += f"- ⚪ Other: {len(other_pods)}\n"
-        result += "\n"
+        summary = [
+            f"**Summary:** {len(pods)} total pods",
+            f"- 🟢 Running: {running_count}",
+            f"- 🟡 Pending: {pending_count}",
+            f"- 🔴 Failed: {failed_count}"
+        ]
+        if other_count:
+            summary.append(f"- ⚪ Other: {other_count}")
+        
+        sections = [f"🚀 **Pods in Namespace `{namespace}`**", *_stale_note(message), "\n".join(summary)]
         
         # List all pods
         for pod in pods:
-            status_icon = {
-                "Running": "🟢",
-                "Pending": "🟡", 
-                "Failed": "🔴",
-                "Succeeded": "✅"
-            }.get(pod.status, "⚪")
-            
+            status_icon = POD_STATUS_ICONS.get(pod.status, "⚪")
             restart_warning = " ⚠️" if pod.restarts > 5 else ""
             
-            result += f"""**{pod.name}**
+            sections.append(f"""**{pod.name}**
 - {status_icon} Status: `{pod.status}`
 - 📊 Ready: `{pod.ready}`
 - 🔄 Restarts: `{pod.restarts}`{restart_warning}
 - 🖥️ Node: `{pod.node}`
-- ⏰ Age: `{pod.age}`
-
-"""
+- ⏰ Age: `{pod.age}`""")
         
-        return result.strip()
+        return "\n\n".join(sections)
     
     def list_all_pods(self) -> str:
         """List pods from all namespaces"""
@@ -190,36 +219,34 @@ class KubernetesOperations:
         if not pods:
             return "📋 No pods found in cluster."
         
-        # Group pods by namespace
-        pods_by_namespace = {}
+        # Group pods by namespace and count running pods in the same pass
+        pods_by_namespace = defaultdict(list)
+        running_by_namespace = Counter()
         for pod in pods:
-            if pod.namespace not in pods_by_namespace:
-                pods_by_namespace[pod.namespace] = []
             pods_by_namespace[pod.namespace].append(pod)
+            if pod.status == "Running":
+                running_by_namespace[pod.namespace] += 1
         
-        result = f"🚀 **All Pods in Cluster** ({len(pods)} total)\n\n"
+        sections = [f"🚀 **All Pods in Cluster** ({len(pods)} total)", *_stale_note(message)]
         
-        for namespace in sorted(pods_by_namespace.keys()):
-            namespace_pods = pods_by_namespace[namespace]
-            running_count = len([p for p in namespace_pods if p.status == "Running"])
+        for namespace, namespace_pods in sorted(pods_by_namespace.items()):
+            running_count = running_by_namespace[namespace]
+            
+            pod_count = len(namespace_pods)
             
-            result += f"**📁 Namespace: `{namespace}`** ({len(namespace_pods)} pods, {running_count} running)\n"
+            lines = [f"**📁 Namespace: `{namespace}`** ({pod_count} pods, {running_count} running)"]
             
-            for pod in namespace_pods[:5]:  # Show first 5 pods per namespace
-                status_icon = {
-                    "Running": "🟢",
-                    "Pending": "🟡",
-                    "Failed": "🔴"
-                }.get(pod.status, "⚪")
-                
-                result += f"  - {status_icon} `{pod.name}` ({pod.status}, {pod.age})\n"
+            for pod in islice(namespace_pods, 5):  # Show first 5 pods per namespace
+                status_icon = POD_STATUS_ICONS.get(pod.status, "⚪")
+                lines.append(f"  - {status_icon} `{pod.name}` ({pod.status}, {pod.age})")
             
-            if len(namespace_pods) > 5:
-                result += f"  - ... and {len(namespace_pods) - 5} more pods\n"
+            extra = pod_count - 5
+            if extra > 0:
+                lines.append(f"  - ... and {extra} more pods")
             
-            result += "\n"
+            sections.append("\n".join(lines))
         
-        return result.strip()
+        return "\n\n".join(sections)
     
     def list_namespaces(self) -> str:
         """List all namespaces in the cluster"""
@@ -234,24 +261,20 @@ class KubernetesOperations:
         if not namespaces:
             return "📋 No namespaces found in cluster."
         
-        result = f"📁 **Cluster Namespaces** ({len(namespaces)} total)\n\n"
+        sections = [f"📁 **Cluster Namespaces** ({len(namespaces)} total)", *_stale_note(message)]
         
-        # Separate system and user namespaces
-        system_namespaces = [ns for ns in namespaces if ns.startswith(('kube-', 'default'))]
-        user_namespaces = [ns for ns in namespaces if not ns.startswith(('kube-', 'default'))]
+        # Separate system and user namespaces in one pass (input is already sorted)
+        system_namespaces, user_namespaces = [], []
+        for ns in namespaces:
+            (system_namespaces if ns.startswith(SYSTEM_NAMESPACE_PREFIXES) else user_namespaces).append(ns)
         
         if system_namespaces:
-            result += "**System Namespaces:**\n"
-            for ns in system_namespaces:
-                result += f"- `{ns}`\n"
-            result += "\n"
+            sections.append("\n".join(["**System Namespaces:**", *(f"- `{ns}`" for ns in system_namespaces)]))
         
         if user_namespaces:
-            result += "**User Namespaces:**\n"
-            for ns in user_namespaces:
-                result += f"- `{ns}`\n"
+            sections.append("\n".join(["**User Namespaces:**", *(f"- `{ns}`" for ns in user_namespaces)]))
         
-        return result.strip()
+        return "\n\n".join(sections)
     
     def get_connection_status(self) -> str:
         """Get current connection status"""
@@ -5,17 +5,15 @@ LangChain tool wrappers for Kubernetes operations
 Step 4: Tool integration for agent
 """
 
+from functools import lru_cache
 from typing import Optional, Type, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Import Kubernetes operations
 KubernetesOperations = None
-# Global shared instance for connection state persistence
-_shared_k8s_ops = None
 
 try:
     from .k8s_operations import KubernetesOperations
-    _shared_k8s_ops = KubernetesOperations()
 except ImportError:
     try:
         # Fallback for different import paths
@@ -23,10 +21,16 @@ except ImportError:
         import os
         sys.path.append(os.path.dirname(__file__))
         from k8s_operations import KubernetesOperations
-        _shared_k8s_ops = KubernetesOperations()
     except ImportError:
         KubernetesOperations = None
-        _shared_k8s_ops = None
+
+
+@lru_cache(maxsize=1)
+def _get_shared_ops() -> Optional["KubernetesOperations"]:
+    """Shared operations instance (keeps connection state), created on first tool call"""
+    if KubernetesOperations is None:
+        return None
+    return KubernetesOperations()
 
 # LangChain tool imports
 try:
@@ -47,21 +51,11 @@ except ImportError:
     
     LANGCHAIN_AVAILABLE = False
 
-from typing import Type, Optional, List, Dict, Any
-from langchain_core.tools import BaseTool
-from langchain_core.callbacks import CallbackManagerForToolRun
-from pydantic import BaseModel, Field
-
-# Import our Kubernetes operations
-try:
-    from ..tools.k8s_operations import KubernetesOperations
-    KUBERNETES_AVAILABLE = True
-except ImportError:
-    KUBERNETES_AVAILABLE = False
-
 
 class ConnectClusterInput(BaseModel):
     """Input for cluster connection tool"""
+    model_config = ConfigDict(frozen=True)
+    
     context: Optional[str] = Field(default=None, description="Specific kubectl context to use (optional)")
     kubeconfig_path: Optional[str] = Field(default=None, description="Path to kubeconfig file (optional)")
 
@@ -76,15 +70,17 @@ class ConnectClusterTool(BaseTool):
     
     def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
         """Execute cluster connection"""
-        if _shared_k8s_ops is None:
+        ops = _get_shared_ops()
+        if ops is None:
             return "❌ Kubernetes client not available."
         
-        return _shared_k8s_ops.connect_to_cluster()
+        return ops.connect_to_cluster()
 
 
 class ClusterStatusInput(BaseModel):
     """Input for cluster status tool"""
-    pass  # No parameters needed
+    # No parameters needed; frozen like the other tool inputs
+    model_config = ConfigDict(frozen=True)
 
 
 class ClusterStatusTool(BaseTool):
@@ -96,21 +92,23 @@ class ClusterStatusTool(BaseTool):
     
     def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
         """Execute cluster status check"""
-        if _shared_k8s_ops is None:
+        ops = _get_shared_ops()
+        if ops is None:
             return "❌ Kubernetes client not available."
         
-        if not _shared_k8s_ops.is_connected():
+        if not ops.is_connected():
             return "❌ Not connected to cluster. Please connect first using connect_to_cluster."
         
         try:
-            return _shared_k8s_ops.get_cluster_overview()
+            return ops.get_cluster_overview()
         except Exception as e:
             return f"❌ Failed to get cluster status: {str(e)}"
 
 
 class ListNodesInput(BaseModel):
     """Input for list nodes tool"""
-    pass  # No parameters needed
+    # No parameters needed; frozen like the other tool inputs
+    model_config = ConfigDict(frozen=True)
 
 
 class ListNodesTool(BaseTool):
@@ -122,20 +120,23 @@ class ListNodesTool(BaseTool):
     
     def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
         """Execute node listing"""
-        if _shared_k8s_ops is None:
+        ops = _get_shared_ops()
+        if ops is None:
             return "❌ Kubernetes client not available."
         
-        if not _shared_k8s_ops.is_connected():
+        if not ops.is_connected():
             return "❌ Not connected to cluster. Please connect first using connect_to_cluster."
         
         try:
-            return _shared_k8s_ops.list_cluster_nodes()
+            return ops.list_cluster_nodes()
         except Exception as e:
             return f"❌ Failed to list nodes: {str(e)}"
 
 
 class ListPodsInput(BaseModel):
     """Input for list pods tool"""
+    model_config = ConfigDict(frozen=True)
+    
     namespace: str = Field(default="default", description="Kubernetes namespace to list pods from")
     all_namespaces: bool = Field(default=False, description="List pods from all namespaces")
 
@@ -155,24 +156,26 @@ class ListPodsTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None
     ) -> str:
         """Execute pod listing"""
-        if _shared_k8s_ops is None:
+        ops = _get_shared_ops()
+        if ops is None:
             return "❌ Kubernetes client not available."
         
-        if not _shared_k8s_ops.is_connected():
+        if not ops.is_connected():
             return "❌ Not connected to cluster. Please connect first using connect_to_cluster."
         
         try:
             if all_namespaces:
-                return _shared_k8s_ops.list_all_pods()
+                return ops.list_all_pods()
             else:
-                return _shared_k8s_ops.list_pods_in_namespace(namespace)
+                return ops.list_pods_in_namespace(namespace)
         except Exception as e:
             return f"❌ Failed to list pods: {str(e)}"
 
 
 class ListNamespacesInput(BaseModel):
     """Input for list namespaces tool"""
-    pass  # No parameters needed
+    # No parameters needed; frozen like the other tool inputs
+    model_config = ConfigDict(frozen=True)
 
 
 class ListNamespacesTool(BaseTool):
@@ -184,14 +187,15 @@ class ListNamespacesTool(BaseTool):
     
     def _run(self, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
         """Execute namespace listing"""
-        if _shared_k8s_ops is None:
+        ops = _get_shared_ops()
+        if ops is None:
             return "❌ Kubernetes client not available."
         
-        if not _shared_k8s_ops.is_connected():
+        if not ops.is_connected():
             return "❌ Not connected to cluster. Please connect first using connect_to_cluster."
         
         try:
-            return _shared_k8s_ops.list_namespaces()
+            return ops.list_namespaces()
         except Exception as e:
             return f"❌ Failed to list namespaces: {str(e)}"
 
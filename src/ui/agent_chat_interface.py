@@ -3,44 +3,120 @@ KubeGenie Agent-powered Chat Interface
 Gradio interface integrated with LangChain agent
 
 Step 4: LangChain agent integration with Gradio
+
+Gradio, the agent (LangChain, OpenAI, Kubernetes client) and python-dotenv
+are imported on first use, so importing this module stays cheap.
 """
 
-import gradio as gr
+from __future__ import annotations
+
 import asyncio
+import json
+import logging
 import os
+import sys
+import time
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, List, Tuple, Optional, Dict
+
+if TYPE_CHECKING:
+    import gradio as gr
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Queue concurrency group for every event that drives the agent. All browser
+# sessions share one KubeGenieAgent and its single conversation memory, so
+# turns and resets run one at a time across every user, never interleaved.
+AGENT_CONCURRENCY_ID = "agent"
+AGENT_CONCURRENCY_LIMIT = 1
+
+# Number of most recent messages rendered in the chatbot; "Load earlier" grows it by this much
+CHAT_WINDOW_SIZE = 50
+
+# How long the rendered status message is reused before asking the agent again
+STATUS_CACHE_TTL = 2.0
+
+# Interface styles (minified)
+_CSS = (
+    ".status-box{padding:15px;margin:10px 0;border-radius:8px;background:#f0f8ff;border-left:4px solid #007acc}"
+    ".example-btn{margin:2px;font-size:.9em}"
+    ".main-container{max-width:1200px;margin:0 auto}"
+)
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-    print("✅ Environment variables loaded from .env")
-except ImportError:
-    print("⚠️ python-dotenv not available - using system environment")
+# Status message lines
+_STATUS_HEADER = "🤖 **KubeGenie Agent Status:**"
+_STATUS_LLM_ACTIVE = "✅ LangChain Agent: Active"
+_STATUS_LLM_FALLBACK = "⚠️ LangChain Agent: Fallback mode"
+_STATUS_K8S_CONNECTED = "✅ Kubernetes: Connected"
+_STATUS_K8S_AVAILABLE = "🔌 Kubernetes: Available (not connected)"
+_STATUS_K8S_UNAVAILABLE = "❌ Kubernetes: Not available"
 
-# Import our agent
-try:
-    import sys
-    import os
-    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-    from agents.base_agent import KubeGenieAgent
-    AGENT_AVAILABLE = True
-except ImportError as e:
-    AGENT_AVAILABLE = False
-    print(f"⚠️ KubeGenieAgent not available: {e}")
+_EXAMPLE_PROMPTS = (
+    "Hello! What can you help me with?",
+    "Connect to my Kubernetes cluster",
+    "Show me the cluster status",
+    "List all nodes in the cluster",
+    "Show pods in the kube-system namespace",
+    "List all namespaces",
+    "What pods are running?",
+    "Help me troubleshoot my cluster",
+    "Explain Kubernetes concepts",
+    "Reset our conversation"
+)
+
+# Shown above the chatbot until the first message is sent
+_WELCOME_MARKDOWN = """👋 **Welcome to KubeGenie!**
+
+I'm your AI Kubernetes Assistant, powered by LangChain and OpenAI. I can help you:
+
+🔗 **Connect to clusters** - Link to your Kubernetes environments
+📊 **Monitor status** - Get real-time cluster health and metrics  
+🚀 **Manage workloads** - Deploy, scale, and troubleshoot applications
+📚 **Learn concepts** - Understand Kubernetes best practices
+🛠️ **Troubleshoot issues** - Diagnose and resolve problems
+
+**To get started:**
+1. Try "Connect to my Kubernetes cluster"
+2. Ask "Show me the cluster status"
+3. Or use any of the quick action buttons →
+
+How can I help you today?"""
 
 
 class KubeGenieAgentChat:
     """Enhanced chat interface with LangChain agent integration"""
     
+    # KubeGenieAgent class once imported, False if the import failed
+    _agent_class = None
+    
+    @classmethod
+    def _load_agent_class(cls):
+        """Import KubeGenieAgent on first use; returns None if unavailable"""
+        if cls._agent_class is None:
+            try:
+                sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+                from agents.base_agent import KubeGenieAgent
+                cls._agent_class = KubeGenieAgent
+            except ImportError as e:
+                cls._agent_class = False
+                logger.warning("KubeGenieAgent not available: %s", e)
+        return cls._agent_class or None
+    
     def __init__(self):
         self.agent = None
         self.initialization_status = "🔄 Initializing..."
+        self._interface = None
         
-        if AGENT_AVAILABLE:
+        # (timestamp, message) of the last rendered status
+        self._status_cache: Tuple[float, str] = (0.0, "")
+        
+        agent_class = self._load_agent_class()
+        if agent_class:
             try:
-                self.agent = KubeGenieAgent()
+                self.agent = agent_class()
                 self.initialization_status = self._get_status_message()
             except Exception as e:
                 self.initialization_status = f"❌ Agent initialization failed: {str(e)}"
@@ -52,87 +128,84 @@ class KubeGenieAgentChat:
         if not self.agent:
             return "❌ Agent not initialized"
         
-        status = self.agent.get_connection_status()
-        
-        parts = ["🤖 **KubeGenie Agent Status:**"]
-        
-        # LangChain status
-        if status.get("langchain_available") and status.get("llm_initialized"):
-            parts.append("✅ LangChain Agent: Active")
-        else:
-            parts.append("⚠️ LangChain Agent: Fallback mode")
+        now = time.monotonic()
+        if self._status_cache[1] and now - self._status_cache[0] < STATUS_CACHE_TTL:
+            return self._status_cache[1]
         
-        # Kubernetes status
-        if status.get("k8s_available"):
-            if status.get("k8s_connected"):
-                parts.append("✅ Kubernetes: Connected")
-            else:
-                parts.append("🔌 Kubernetes: Available (not connected)")
-        else:
-            parts.append("❌ Kubernetes: Not available")
-        
-        # Session info
-        parts.append(f"🆔 Session: {status.get('session_id', 'Unknown')}")
+        status = self.agent.get_connection_status()
+        langchain_available, llm_initialized, k8s_available, k8s_connected = map(
+            status.get,
+            ("langchain_available", "llm_initialized", "k8s_available", "k8s_connected")
+        )
+        session_id = status.get("session_id", "Unknown")
         
-        return "\n".join(parts)
+        message = "\n".join((
+            _STATUS_HEADER,
+            # LangChain status
+            _STATUS_LLM_ACTIVE if langchain_available and llm_initialized else _STATUS_LLM_FALLBACK,
+            # Kubernetes status
+            (_STATUS_K8S_CONNECTED if k8s_connected else _STATUS_K8S_AVAILABLE)
+            if k8s_available else _STATUS_K8S_UNAVAILABLE,
+            # Session info
+            f"🆔 Session: {session_id}"
+        ))
+        self._status_cache = (now, message)
+        return message
     
-    def process_message(self, message: str, chat_history: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], str]:
-        """Process user message and return updated chat history"""
+    def invalidate_status(self):
+        """Force the next status request to query the agent"""
+        self._status_cache = (0.0, "")
+    
+    async def process_message(
+        self,
+        message: str,
+        chat_history: List[Dict[str, str]]
+    ) -> AsyncIterator[Tuple[List[Dict[str, str]], str]]:
+        """
+        Process user message and stream the updated chat history
+        
+        Each piece from the agent (a tool progress line or the final answer)
+        is appended to the last assistant message and the history is yielded,
+        so tool calls show up while the agent is still working.
+        """
         
         if not message.strip():
-            return chat_history, ""
+            yield chat_history, ""
+            return
+        
+        # Update chat history with messages format, in place (it is the session's state)
+        chat_history.append({"role": "user", "content": message})
+        chat_history.append({"role": "assistant", "content": ""})
         
         # Get AI response
         if self.agent:
-            ai_response = self.agent.chat(message)
+            chunks = self.agent.stream(message)
+            while True:
+                # The agent blocks on network I/O, so pull each piece off the event loop
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                chat_history[-1]["content"] += chunk
+                yield chat_history, ""
         else:
-            ai_response = "❌ Agent not available. Please check the setup."
-        
-        # Update chat history with messages format
-        updated_history = chat_history + [
-            {"role": "user", "content": message},
-            {"role": "assistant", "content": ai_response}
-        ]
+            chat_history[-1]["content"] = "❌ Agent not available. Please check the setup."
         
-        return updated_history, ""  # Return empty string to clear input
+        yield chat_history, ""  # Return empty string to clear input
     
-    def get_example_prompts(self) -> List[str]:
+    def get_example_prompts(self) -> Tuple[str, ...]:
         """Get list of example prompts for users"""
-        return [
-            "Hello! What can you help me with?",
-            "Connect to my Kubernetes cluster",
-            "Show me the cluster status",
-            "List all nodes in the cluster",
-            "Show pods in the kube-system namespace",
-            "List all namespaces",
-            "What pods are running?",
-            "Help me troubleshoot my cluster",
-            "Explain Kubernetes concepts",
-            "Reset our conversation"
-        ]
+        return _EXAMPLE_PROMPTS
     
     def create_interface(self) -> gr.Blocks:
-        """Create and configure Gradio interface"""
+        """Create and configure Gradio interface (built once per instance)"""
+        if self._interface is not None:
+            return self._interface
+        
+        import gradio as gr
         
         with gr.Blocks(
             title="KubeGenie - AI Kubernetes Assistant",
-            css="""
-                .status-box { 
-                    padding: 15px; 
-                    margin: 10px 0; 
-                    border-radius: 8px; 
-                    background: #f0f8ff; 
-                    border-left: 4px solid #007acc; 
-                }
-                .example-btn { 
-                    margin: 2px; 
-                    font-size: 0.9em; 
-                }
-                .main-container { 
-                    max-width: 1200px; 
-                    margin: 0 auto; 
-                }
-            """
+            css=_CSS
         ) as interface:
             
             gr.Markdown("""
@@ -149,9 +222,15 @@ class KubeGenieAgentChat:
                 elem_classes=["status-box"]
             )
             
+            # Full transcript; the chatbot only renders its last window_size messages
+            full_history_state = gr.State([])
+            window_size_state = gr.State(CHAT_WINDOW_SIZE)
+            
             # Main chat interface
             with gr.Row():
                 with gr.Column(scale=4):
+                    welcome_display = gr.Markdown(_WELCOME_MARKDOWN, elem_classes=["status-box"])
+                    load_earlier_btn = gr.Button("⬆️ Load earlier messages", size="sm")
                     chatbot = gr.Chatbot(
                         value=[],
                         height=500,
@@ -174,15 +253,18 @@ class KubeGenieAgentChat:
                 with gr.Column(scale=1):
                     gr.Markdown("### 💡 Quick Actions")
                     
-                    # Example buttons
-                    example_buttons = []
+                    # Example buttons fill the input box client-side, without a server round trip
                     for example in self.get_example_prompts():
                         btn = gr.Button(
                             example,
                             elem_classes=["example-btn"],
                             size="sm"
                         )
-                        example_buttons.append(btn)
+                        btn.click(
+                            fn=None,
+                            js=f"() => {json.dumps(example)}",
+                            outputs=[msg_input]
+                        )
                     
                     gr.Markdown("### ⚡ Quick Commands")
                     refresh_status_btn = gr.Button("🔄 Refresh Status", size="sm")
@@ -190,43 +272,55 @@ class KubeGenieAgentChat:
                     reset_agent_btn = gr.Button("🔄 Reset Agent", size="sm")
             
             # Event handlers
-            def submit_message(message, history):
-                return self.process_message(message, history)
+            async def submit_message(message, history, window_size):
+                async for updated_history, cleared_input in self.process_message(message, history):
+                    yield (
+                        updated_history[-window_size:],
+                        updated_history,
+                        cleared_input,
+                        gr.update(visible=not updated_history)
+                    )
             
-            def use_example(example_text):
-                return example_text
+            def load_earlier(history, window_size):
+                window_size += CHAT_WINDOW_SIZE
+                return history[-window_size:], window_size
             
             def refresh_status():
                 return self._get_status_message()
             
             def clear_chat():
-                return []
+                return [], [], CHAT_WINDOW_SIZE, gr.update(visible=True)
             
-            def reset_agent():
+            async def reset_agent():
                 if self.agent:
-                    self.agent.reset_conversation()
-                return "🔄 Agent conversation reset", []
+                    await asyncio.to_thread(self.agent.reset_conversation)
+                self.invalidate_status()
+                return "🔄 Agent conversation reset", [], [], CHAT_WINDOW_SIZE, gr.update(visible=True)
             
             # Wire up events
             msg_input.submit(
                 fn=submit_message,
-                inputs=[msg_input, chatbot],
-                outputs=[chatbot, msg_input]
+                inputs=[msg_input, full_history_state, window_size_state],
+                outputs=[chatbot, full_history_state, msg_input, welcome_display],
+                queue=True,
+                concurrency_limit=AGENT_CONCURRENCY_LIMIT,
+                concurrency_id=AGENT_CONCURRENCY_ID
             )
             
             send_btn.click(
                 fn=submit_message,
-                inputs=[msg_input, chatbot],
-                outputs=[chatbot, msg_input]
+                inputs=[msg_input, full_history_state, window_size_state],
+                outputs=[chatbot, full_history_state, msg_input, welcome_display],
+                queue=True,
+                concurrency_limit=AGENT_CONCURRENCY_LIMIT,
+                concurrency_id=AGENT_CONCURRENCY_ID
             )
             
-            # Example button events
-            for btn in example_buttons:
-                btn.click(
-                    fn=use_example,
-                    inputs=[btn],
-                    outputs=[msg_input]
-                )
+            load_earlier_btn.click(
+                fn=load_earlier,
+                inputs=[full_history_state, window_size_state],
+                outputs=[chatbot, window_size_state]
+            )
             
             # Utility button events
             refresh_status_btn.click(
@@ -236,48 +330,51 @@ class KubeGenieAgentChat:
             
             clear_chat_btn.click(
                 fn=clear_chat,
-                outputs=[chatbot]
+                outputs=[chatbot, full_history_state, window_size_state, welcome_display]
             )
             
             reset_agent_btn.click(
                 fn=reset_agent,
-                outputs=[status_display, chatbot]
-            )
-            
-            # Initial welcome message
-            interface.load(
-                fn=lambda: [{"role": "assistant", "content": """👋 **Welcome to KubeGenie!**
-
-I'm your AI Kubernetes Assistant, powered by LangChain and OpenAI. I can help you:
-
-🔗 **Connect to clusters** - Link to your Kubernetes environments
-📊 **Monitor status** - Get real-time cluster health and metrics  
-🚀 **Manage workloads** - Deploy, scale, and troubleshoot applications
-📚 **Learn concepts** - Understand Kubernetes best practices
-🛠️ **Troubleshoot issues** - Diagnose and resolve problems
-
-**To get started:**
-1. Try "Connect to my Kubernetes cluster"
-2. Ask "Show me the cluster status"
-3. Or use any of the quick action buttons →
-
-How can I help you today?"""}],
-                outputs=[chatbot]
+                outputs=[status_display, chatbot, full_history_state, window_size_state, welcome_display],
+                concurrency_limit=AGENT_CONCURRENCY_LIMIT,
+                concurrency_id=AGENT_CONCURRENCY_ID
             )
         
+        self._interface = interface
         return interface
 
 
+@lru_cache(maxsize=1)
+def _get_chat() -> KubeGenieAgentChat:
+    """Process-wide chat interface, so repeated main() calls reuse the booted agent"""
+    return KubeGenieAgentChat()
+
+
 def main():
     """Launch the KubeGenie Agent Chat Interface"""
     
-    print("🚀 Starting KubeGenie Agent Chat Interface...")
-    print(f"⏰ Timestamp: {datetime.now()}")
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    # Load environment variables from .env file
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+        logger.info("✅ Environment variables loaded from .env")
+    except ImportError:
+        logger.warning("⚠️ python-dotenv not available - using system environment")
+    
+    logger.info("🚀 Starting KubeGenie Agent Chat Interface...")
+    logger.info("⏰ Timestamp: %s", datetime.now())
     
     # Create chat interface
-    chat = KubeGenieAgentChat()
+    chat = _get_chat()
     interface = chat.create_interface()
     
+    # Queue events so slow agent calls do not block other UI actions. The
+    # default limit only covers the lightweight events (load earlier, refresh
+    # status, clear); agent events keep AGENT_CONCURRENCY_LIMIT.
+    interface.queue(default_concurrency_limit=10)
+    
     # Launch with configuration
     interface.launch(
         server_name="0.0.0.0",
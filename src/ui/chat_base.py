@@ -0,0 +1,197 @@
+"""
+Shared base for the keyword-driven KubeGenie chat interfaces
+
+KubeGenieChat and KubeGenieChatFixed differ only in how they route intents
+and in a few replies; the Kubernetes wiring, the replies they have in common
+and the dispatch scaffolding live here.
+"""
+
+import os
+import re
+import sys
+from importlib import import_module
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Kubernetes operations are imported when the chat is created; only check the client is installed here
+KUBERNETES_AVAILABLE = find_spec("kubernetes") is not None
+if not KUBERNETES_AVAILABLE:
+    print("⚠️ Kubernetes client not available - install requirements.txt")
+
+# Kubernetes client status shown in replies; KUBERNETES_AVAILABLE is fixed at import
+_K8S_STATUS_STR = "✅ Ready" if KUBERNETES_AVAILABLE else "❌ Not available"
+
+_search_namespace_arg = re.compile(r"\bnamespace\s+([a-z0-9-]+)", re.IGNORECASE).search
+
+# Custom CSS for KubeGenie styling (minified)
+_CUSTOM_CSS = ".gradio-container{max-width:1200px !important}.chat-message{font-size:14px !important}"
+
+# Canned responses, built once at import
+_RESP_HELLO = f"""👋 Hello! I'm KubeGenie, your AI Kubernetes Assistant.
+
+I can help you with:
+🔍 **Cluster monitoring** - Check pod status, node health, resource usage
+💰 **Cost optimization** - Find unused resources, rightsizing recommendations  
+🔒 **Security analysis** - RBAC checks, policy compliance, vulnerability scans
+☁️ **Multi-cloud management** - Provision and manage cloud infrastructure with Crossplane
+
+**Current Status:**
+- ✅ Chat interface active
+- {_K8S_STATUS_STR} Kubernetes client (Step 3)
+- ⏳ LangChain agents (Step 4+)
+
+Try asking: "Connect to cluster" or "Show cluster status" """
+
+_RESP_CROSSPLANE = """☁️ **Crossplane Multi-Cloud Integration:**
+
+**Planned for Step 13** - This will be a game-changer!
+
+**What Crossplane Adds:**
+- 🌐 **Multi-cloud provisioning**: AWS, GCP, Azure resources via Kubernetes APIs
+- 🔧 **Infrastructure as Code**: Declarative cloud resource management
+- 🎛️ **Platform Engineering**: Self-service infrastructure for dev teams
+- 💰 **Cross-cloud cost optimization**: Unified cost management
+- 🔒 **Policy-driven governance**: Automated compliance across clouds
+
+**Example Future Commands:**
+- "Create a staging environment in GCP"
+- "Add S3 and RDS to payments namespace"  
+- "Show cloud cost breakdown by team"
+- "Provision disaster recovery in another region" """
+
+_RESP_CONNECT_FIRST = "❌ Connect to cluster first: ask me to 'connect to cluster'"
+
+
+def _import_tools_module(name: str):
+    """Import src/tools/<name>, whether the chat runs from the src package or as a script"""
+    if __package__:
+        return import_module(f"..tools.{name}", __package__)
+    
+    # Run as a script (python src/ui/...): no parent package, so put src/ on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return import_module(f"tools.{name}")
+
+
+class _BaseKubeGenieChat:
+    """Kubernetes wiring, shared replies and intent dispatch for the keyword chat interfaces"""
+    
+    # Reply texts by intent; subclasses add "status", "capabilities" and "fallback"
+    _RESPONSES = MappingProxyType({
+        "hello": _RESP_HELLO,
+        "crossplane": _RESP_CROSSPLANE
+    })
+    
+    # (matcher, handler) pairs in priority order, set by each subclass
+    _INTENT_ROUTES: Tuple = ()
+    
+    def __init__(self):
+        self.conversation_history: List[Dict[str, str]] = []
+        
+        # Initialize Kubernetes operations if available
+        self.k8s_ops = None
+        if KUBERNETES_AVAILABLE:
+            try:
+                self.k8s_ops = _import_tools_module("k8s_operations").KubernetesOperations()
+            except Exception:
+                print("⚠️ Could not initialize Kubernetes operations")
+        
+        # Fixed for the lifetime of the chat, so checked once here
+        self.k8s_available = self.k8s_ops is not None
+    
+    def _dispatch(self, message: str) -> str:
+        """Reply from the first matching intent, or the fallback text"""
+        handler = self._route(message)
+        if handler:
+            return handler(self, message)
+        
+        return self._RESPONSES["fallback"].format(message=message)
+    
+    def _route(self, message: str) -> Optional[Callable[..., str]]:
+        """Handler for the first route whose matcher finds its keywords, if any"""
+        for matches, handler in self._INTENT_ROUTES:
+            if matches(message):
+                return handler
+        return None
+    
+    def _is_connected(self) -> bool:
+        """Whether Kubernetes operations are available and connected to a cluster"""
+        return self.k8s_available and self.k8s_ops.is_connected()
+    
+    def _reply_greeting(self, message: str) -> str:
+        """Greeting with an overview of what KubeGenie can do"""
+        return self._RESPONSES["hello"]
+    
+    def _reply_status(self, message: str) -> str:
+        """System status, plus the cluster overview when connected"""
+        # Try to get cluster status if connected
+        cluster_status = ""
+        if self._is_connected():
+            cluster_status = "\n\n" + self.k8s_ops.get_cluster_overview()
+        elif self.k8s_available:
+            cluster_status = "\n\n" + self.k8s_ops.get_connection_status()
+        
+        return self._RESPONSES["status"].format(k8s_status=_K8S_STATUS_STR, cluster_status=cluster_status)
+    
+    def _reply_capabilities(self, message: str) -> str:
+        """Capability roadmap"""
+        return self._RESPONSES["capabilities"]
+    
+    def _reply_connect(self, message: str) -> str:
+        """Connect to the cluster from the default kubeconfig"""
+        if not KUBERNETES_AVAILABLE:
+            return "❌ Kubernetes client not available. Install requirements: `pip install -r requirements.txt`"
+        
+        if not self.k8s_available:
+            return "❌ Kubernetes operations not initialized. Check configuration."
+        
+        try:
+            return self.k8s_ops.connect_to_cluster()
+        except Exception as e:
+            return f"❌ Connection failed: {str(e)}\n\nTroubleshooting:\n- Check kubectl config: `kubectl cluster-info`\n- Verify kubeconfig: `~/.kube/config`"
+    
+    def _reply_cluster_status(self, message: str) -> str:
+        """Cluster overview"""
+        if not self.k8s_available:
+            return "❌ Kubernetes client not available. Install requirements first."
+        
+        if not self.k8s_ops.is_connected():
+            return "❌ Not connected to cluster. Ask me to 'connect to cluster' first."
+        
+        return self.k8s_ops.get_cluster_overview()
+    
+    def _reply_nodes(self, message: str) -> str:
+        """List cluster nodes"""
+        if not self._is_connected():
+            return _RESP_CONNECT_FIRST
+        
+        return self.k8s_ops.list_cluster_nodes()
+    
+    def _reply_all_pods(self, message: str) -> str:
+        """List pods across all namespaces"""
+        if not self._is_connected():
+            return _RESP_CONNECT_FIRST
+        
+        return self.k8s_ops.list_all_pods()
+    
+    def _reply_pods(self, message: str) -> str:
+        """List pods in the namespace named in the message (default otherwise)"""
+        if not self._is_connected():
+            return _RESP_CONNECT_FIRST
+        
+        # Check if specific namespace mentioned
+        namespace_match = _search_namespace_arg(message)
+        namespace = namespace_match.group(1).lower() if namespace_match else "default"
+        
+        return self.k8s_ops.list_pods_in_namespace(namespace)
+    
+    def _reply_namespaces(self, message: str) -> str:
+        """List cluster namespaces"""
+        if not self._is_connected():
+            return _RESP_CONNECT_FIRST
+        
+        return self.k8s_ops.list_namespaces()
+    
+    def _reply_crossplane(self, message: str) -> str:
+        """Crossplane integration plans"""
+        return self._RESPONSES["crossplane"]
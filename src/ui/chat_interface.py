@@ -3,77 +3,64 @@ KubeGenie Chat Interface
 Gradio-based conversational UI for Kubernetes management
 
 Step 3: Enhanced with Kubernetes client integration
+
+Gradio and the Kubernetes client are imported on first use, so importing
+this module stays cheap.
 """
 
-import gradio as gr
+from __future__ import annotations
+
 import os
-from typing import List, Tuple
+import re
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Tuple
 from datetime import datetime
 
-# Import Kubernetes operations (with fallback)
 try:
-    from ..tools.k8s_operations import KubernetesOperations
-    from ..tools.k8s_client import get_available_contexts, get_current_context
-    KUBERNETES_AVAILABLE = True
+    from .chat_base import _BaseKubeGenieChat, _CUSTOM_CSS, _import_tools_module
 except ImportError:
-    KUBERNETES_AVAILABLE = False
-    print("⚠️ Kubernetes client not available - install requirements.txt")
+    # Run as a script (python src/ui/chat_interface.py): no parent package
+    from chat_base import _BaseKubeGenieChat, _CUSTOM_CSS, _import_tools_module
+
+if TYPE_CHECKING:
+    import gradio as gr
+
+# Intent matchers: bound search methods of patterns compiled once at import.
+# Lookaheads let one pattern require several keywords in any order.
+_search_greeting = re.compile(r"\b(?:hello|hi|hey)\b", re.IGNORECASE).search
+_search_status = re.compile(r"\b(?:status|health)", re.IGNORECASE).search
+_search_capabilities = re.compile(r"\bcapabilities\b|\bwhat can you do\b", re.IGNORECASE).search
+_search_connect = re.compile(r"^(?=.*\bconnect)(?=.*\bcluster)", re.IGNORECASE | re.DOTALL).search
+_search_cluster_status = re.compile(r"^(?=.*\bcluster)(?=.*\b(?:status|overview)\b)", re.IGNORECASE | re.DOTALL).search
+_search_nodes = re.compile(r"\bnodes?\b", re.IGNORECASE).search
+_search_all_pods = re.compile(r"^(?=.*\bpods\b)(?=.*\ball\b)", re.IGNORECASE | re.DOTALL).search
+_search_pods = re.compile(r"\bpods\b", re.IGNORECASE).search
+_search_namespaces = re.compile(r"\bnamespaces?\b", re.IGNORECASE).search
+_search_cluster = re.compile(r"\bcluster", re.IGNORECASE).search
+_search_cloud = re.compile(r"\b(?:crossplane|cloud)", re.IGNORECASE).search
+
+# Canned responses, built once at import
+_RESP_FALLBACK_TEMPLATE = """🤔 I understand you said: "{message}"
 
+**Current Status:** I'm in early development (Step 2 of 15)
 
-class KubeGenieChat:
-    """Main chat interface for KubeGenie AI Kubernetes Assistant"""
-    
-    def __init__(self):
-        self.conversation_history: List[dict] = []
-        self.cluster_connected = False
-        
-        # Initialize Kubernetes operations if available
-        if KUBERNETES_AVAILABLE:
-            self.k8s_ops = KubernetesOperations()
-        else:
-            self.k8s_ops = None
-        
-    def process_message(self, message: str, history: List[dict]) -> str:
-        """Process user message and return AI response"""
-        
-        # Store conversation history
-        self.conversation_history = history
-        
-        # Simple responses for testing (will be replaced with LangChain agent)
-        if not message.strip():
-            return "Please enter a message."
-            
-        # Enhanced command recognition with Kubernetes integration
-        message_lower = message.lower()
-        
-        # Check if Kubernetes operations are available
-        k8s_status = "✅ Ready" if KUBERNETES_AVAILABLE else "❌ Not available"
-        
-        if any(word in message_lower for word in ['hello', 'hi', 'hey']):
-            return f"""👋 Hello! I'm KubeGenie, your AI Kubernetes Assistant.
-
-I can help you with:
-🔍 **Cluster monitoring** - Check pod status, node health, resource usage
-💰 **Cost optimization** - Find unused resources, rightsizing recommendations  
-🔒 **Security analysis** - RBAC checks, policy compliance, vulnerability scans
-☁️ **Multi-cloud management** - Provision and manage cloud infrastructure with Crossplane
-
-**Current Status:**
-- ✅ Chat interface active
-- {k8s_status} Kubernetes client (Step 3)
-- ⏳ LangChain agents (Step 4+)
-
-Try asking: "Connect to cluster" or "Show cluster status" """
-
-        elif 'status' in message_lower or 'health' in message_lower:
-            # Try to get cluster status if connected
-            cluster_status = ""
-            if KUBERNETES_AVAILABLE and self.k8s_ops and self.k8s_ops.is_connected():
-                cluster_status = "\n\n" + self.k8s_ops.get_cluster_overview()
-            elif KUBERNETES_AVAILABLE and self.k8s_ops:
-                cluster_status = "\n\n" + self.k8s_ops.get_connection_status()
-            
-            return f"""📊 **System Status:**
+Right now I can respond to:
+- Greetings and introductions
+- Status and health checks  
+- Capability questions
+- Cluster and cloud integration questions
+
+**Coming Soon (Steps 3-4):**
+- Real Kubernetes cluster connectivity
+- LangChain AI agent for intelligent responses
+- Natural language command processing
+
+**Try asking:**
+- "What's your current status?"
+- "What are your capabilities?"
+- "Tell me about Crossplane integration" """
+
+_RESP_STATUS_TEMPLATE = """📊 **System Status:**
 - 🤖 KubeGenie Chat: ✅ Active
 - 🔗 Kubernetes Client: {k8s_status}
 - 🧠 LangChain Agents: ⏳ In development (Step 4+)
@@ -84,8 +71,7 @@ Step 2: ✅ Basic Gradio interface
 Step 3: 🔄 Kubernetes client setup (current)
 Step 4: 🔄 LangChain basic agent{cluster_status}"""
 
-        elif 'capabilities' in message_lower or 'what can you do' in message_lower:
-            return """🚀 **KubeGenie Capabilities (Full Roadmap):**
+_RESP_CAPABILITIES = """🚀 **KubeGenie Capabilities (Full Roadmap):**
 
 **Phase 1: Foundation**
 - ✅ Conversational chat interface
@@ -106,72 +92,7 @@ Step 4: 🔄 LangChain basic agent{cluster_status}"""
 
 **Current Progress:** Step 2 of 15 complete"""
 
-        elif 'connect' in message_lower and 'cluster' in message_lower:
-            if not KUBERNETES_AVAILABLE:
-                return "❌ Kubernetes client not available. Install requirements: `pip install -r requirements.txt`"
-            
-            try:
-                return self.k8s_ops.connect_to_cluster()
-            except Exception as e:
-                return f"❌ Connection failed: {str(e)}\n\nTroubleshooting:\n- Check kubectl config: `kubectl cluster-info`\n- Verify kubeconfig: `~/.kube/config`"
-        
-        elif 'cluster' in message_lower and ('status' in message_lower or 'overview' in message_lower):
-            if not KUBERNETES_AVAILABLE:
-                return "❌ Kubernetes client not available. Install requirements first."
-            
-            if not self.k8s_ops.is_connected():
-                return "❌ Not connected to cluster. Ask me to 'connect to cluster' first."
-            
-            return self.k8s_ops.get_cluster_overview()
-        
-        elif 'nodes' in message_lower or 'node' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_cluster_nodes()
-        
-        elif 'pods' in message_lower and 'all' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_all_pods()
-        
-        elif 'pods' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            # Check if specific namespace mentioned
-            namespace = "default"
-            if 'namespace' in message_lower:
-                words = message_lower.split()
-                try:
-                    ns_index = words.index('namespace')
-                    if ns_index + 1 < len(words):
-                        namespace = words[ns_index + 1]
-                except ValueError:
-                    pass
-            
-            return self.k8s_ops.list_pods_in_namespace(namespace)
-        
-        elif 'namespaces' in message_lower or 'namespace' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_namespaces()
-        
-        elif 'cluster' in message_lower:
-            if KUBERNETES_AVAILABLE:
-                current_context = get_current_context() if 'get_current_context' in globals() else None
-                contexts = get_available_contexts() if 'get_available_contexts' in globals() else []
-                
-                context_info = ""
-                if current_context:
-                    context_info = f"\n**Current Context:** `{current_context}`"
-                
-                if contexts:
-                    context_info += f"\n**Available Contexts:** {', '.join([f'`{c}`' for c in contexts[:5]])}"
-                
-                return f"""🔗 **Kubernetes Cluster Integration:**
+_RESP_CLUSTER_INFO_TEMPLATE = """🔗 **Kubernetes Cluster Integration:**
 
 **Current Status:** ✅ Client Ready (Step 3)
 
@@ -186,8 +107,8 @@ Step 4: 🔄 LangChain basic agent{cluster_status}"""
 {context_info}
 
 **Ready for real cluster operations!** 🚀"""
-            else:
-                return """🔗 **Kubernetes Cluster Integration:**
+
+_RESP_CLUSTER_UNAVAILABLE = """🔗 **Kubernetes Cluster Integration:**
 
 **Current Status:** ❌ Not Available
 
@@ -202,63 +123,76 @@ pip install -r requirements.txt
 - Switch between multiple cluster contexts
 - Get comprehensive cluster health reports"""
 
-        elif 'crossplane' in message_lower or 'cloud' in message_lower:
-            return """☁️ **Crossplane Multi-Cloud Integration:**
-
-**Planned for Step 13** - This will be a game-changer!
-
-**What Crossplane Adds:**
-- 🌐 **Multi-cloud provisioning**: AWS, GCP, Azure resources via Kubernetes APIs
-- 🔧 **Infrastructure as Code**: Declarative cloud resource management
-- 🎛️ **Platform Engineering**: Self-service infrastructure for dev teams
-- 💰 **Cross-cloud cost optimization**: Unified cost management
-- 🔒 **Policy-driven governance**: Automated compliance across clouds
-
-**Example Future Commands:**
-- "Create a staging environment in GCP"
-- "Add S3 and RDS to payments namespace"  
-- "Show cloud cost breakdown by team"
-- "Provision disaster recovery in another region" """
 
+class KubeGenieChat(_BaseKubeGenieChat):
+    """Main chat interface for KubeGenie AI Kubernetes Assistant"""
+    
+    _RESPONSES = MappingProxyType({
+        **_BaseKubeGenieChat._RESPONSES,
+        "status": _RESP_STATUS_TEMPLATE,
+        "capabilities": _RESP_CAPABILITIES,
+        "fallback": _RESP_FALLBACK_TEMPLATE
+    })
+    
+    def __init__(self):
+        super().__init__()
+        self.cluster_connected = False
+        
+    def process_message(self, message: str, history: List[dict]) -> str:
+        """Process user message and return AI response"""
+        
+        # Store conversation history
+        self.conversation_history = history
+        
+        # Simple responses for testing (will be replaced with LangChain agent)
+        if not message or message.isspace():
+            return "Please enter a message."
+            
+        return self._dispatch(message)
+    
+    def _reply_cluster(self, message: str) -> str:
+        """Cluster integration help with the kubeconfig contexts"""
+        if self.k8s_available:
+            k8s_client = _import_tools_module("k8s_client")
+            current_context = k8s_client.get_current_context()
+            contexts = k8s_client.get_available_contexts()
+            
+            context_parts = []
+            if current_context:
+                context_parts.append(f"\n**Current Context:** `{current_context}`")
+            
+            if contexts:
+                context_parts.append(f"\n**Available Contexts:** {', '.join(f'`{c}`' for c in contexts[:5])}")
+            context_info = "".join(context_parts)
+            
+            return _RESP_CLUSTER_INFO_TEMPLATE.format(context_info=context_info)
         else:
-            return f"""🤔 I understand you said: "{message}"
-
-**Current Status:** I'm in early development (Step 2 of 15)
-
-Right now I can respond to:
-- Greetings and introductions
-- Status and health checks  
-- Capability questions
-- Cluster and cloud integration questions
-
-**Coming Soon (Steps 3-4):**
-- Real Kubernetes cluster connectivity
-- LangChain AI agent for intelligent responses
-- Natural language command processing
-
-**Try asking:**
-- "What's your current status?"
-- "What are your capabilities?"
-- "Tell me about Crossplane integration" """
+            return _RESP_CLUSTER_UNAVAILABLE
+    
+    # Intents in priority order; the first matcher that finds its keywords wins
+    _INTENT_ROUTES = (
+        (_search_greeting, _BaseKubeGenieChat._reply_greeting),
+        (_search_status, _BaseKubeGenieChat._reply_status),
+        (_search_capabilities, _BaseKubeGenieChat._reply_capabilities),
+        (_search_connect, _BaseKubeGenieChat._reply_connect),
+        (_search_cluster_status, _BaseKubeGenieChat._reply_cluster_status),
+        (_search_nodes, _BaseKubeGenieChat._reply_nodes),
+        (_search_all_pods, _BaseKubeGenieChat._reply_all_pods),
+        (_search_pods, _BaseKubeGenieChat._reply_pods),
+        (_search_namespaces, _BaseKubeGenieChat._reply_namespaces),
+        (_search_cluster, _reply_cluster),
+        (_search_cloud, _BaseKubeGenieChat._reply_crossplane),
+    )
 
     def create_interface(self) -> gr.Blocks:
         """Create and configure the Gradio chat interface"""
-        
-        # Custom CSS for KubeGenie styling
-        custom_css = """
-        .gradio-container {
-            max-width: 1200px !important;
-        }
-        .chat-message {
-            font-size: 14px !important;
-        }
-        """
+        import gradio as gr
         
         # Create the chat interface
         with gr.Blocks(
             title="KubeGenie - AI Kubernetes Assistant",
             theme=gr.themes.Soft(),
-            css=custom_css
+            css=_CUSTOM_CSS
         ) as interface:
             
             gr.Markdown("""
@@ -292,7 +226,7 @@ Right now I can respond to:
             # Handle message submission with messages format
             def handle_message(message: str, history: List[dict]):
                 """Handle message submission with proper messages format"""
-                if not message.strip():
+                if not message or message.isspace():
                     return history, ""
                 
                 # Add user message to history
@@ -3,145 +3,76 @@ Fixed KubeGenie Chat Interface
 Clean implementation with proper Gradio messages format
 
 Step 3: Enhanced with Kubernetes client integration (Fixed)
+
+Gradio and the Kubernetes client are imported on first use, so importing
+this module stays cheap.
 """
 
-import gradio as gr
+from __future__ import annotations
+
 import os
-from typing import List, Dict
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, List, Dict, Optional, Tuple
 from datetime import datetime
 
-# Import Kubernetes operations (with fallback)
 try:
-    from ..tools.k8s_operations import KubernetesOperations
-    KUBERNETES_AVAILABLE = True
+    from .chat_base import _BaseKubeGenieChat, _CUSTOM_CSS, _K8S_STATUS_STR
 except ImportError:
-    KUBERNETES_AVAILABLE = False
-    print("⚠️ Kubernetes client not available - install requirements.txt")
-
-
-class KubeGenieChatFixed:
-    """Main chat interface for KubeGenie AI Kubernetes Assistant - Fixed Version"""
-    
-    def __init__(self):
-        self.conversation_history: List[Dict[str, str]] = []
-        
-        # Initialize Kubernetes operations if available
-        if KUBERNETES_AVAILABLE:
-            try:
-                self.k8s_ops = KubernetesOperations()
-            except Exception:
-                self.k8s_ops = None
-                print("⚠️ Could not initialize Kubernetes operations")
-        else:
-            self.k8s_ops = None
-        
-    def process_user_message(self, message: str, history: List[Dict[str, str]]) -> tuple:
-        """Process user message and return updated history"""
-        
-        if not message.strip():
-            return history, ""
-        
-        # Enhanced command recognition with Kubernetes integration
-        message_lower = message.lower()
-        
-        # Check if Kubernetes operations are available
-        k8s_status = "✅ Ready" if KUBERNETES_AVAILABLE else "❌ Not available"
-        
-        # Generate response based on message
-        response = self._generate_response(message, message_lower, k8s_status)
-        
-        # Add both user message and assistant response to history
-        new_history = history + [
-            {"role": "user", "content": message},
-            {"role": "assistant", "content": response}
-        ]
-        
-        return new_history, ""
-    
-    def _generate_response(self, message: str, message_lower: str, k8s_status: str) -> str:
-        """Generate response based on user message"""
-        
-        if any(word in message_lower for word in ['hello', 'hi', 'hey']):
-            return f"""👋 Hello! I'm KubeGenie, your AI Kubernetes Assistant.
+    # Run as a script (python src/ui/chat_interface_fixed.py): no parent package
+    from chat_base import _BaseKubeGenieChat, _CUSTOM_CSS, _K8S_STATUS_STR
+
+if TYPE_CHECKING:
+    import gradio as gr
+
+# Gradio queue: pending submissions, submissions handled per call, and calls running at once
+CHAT_QUEUE_SIZE = 64
+CHAT_MAX_BATCH_SIZE = 8
+CHAT_CONCURRENCY_LIMIT = 4
+
+# Messages whose matched route is remembered; chat input repeats a lot
+INTENT_CACHE_SIZE = 256
+
+# Every intent keyword in one alternation, so a message is scanned once.
+# The name of the group that matched says which keyword was found.
+_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    r"(?P<greeting>hello|hi|hey)\b"
+    r"|(?P<connect>connect)"
+    r"|(?P<cluster>cluster)"
+    r"|(?P<overview>overview)\b"
+    r"|(?P<nodes>nodes?)\b"
+    r"|(?P<pods>pods)\b"
+    r"|(?P<all>all)\b"
+    r"|(?P<namespace>namespaces?)\b"
+    r"|(?P<status>status)"
+    r"|(?P<health>health)"
+    r"|(?P<capabilities>capabilities\b|what can you do\b)"
+    r"|(?P<cloud>crossplane|cloud)"
+    r")",
+    re.IGNORECASE
+)
+
+# Canned responses, built once at import
+_RESP_FALLBACK_TEMPLATE = """🤔 I understand you said: "{message}"
 
-I can help you with:
-🔍 **Cluster monitoring** - Check pod status, node health, resource usage
-💰 **Cost optimization** - Find unused resources, rightsizing recommendations  
-🔒 **Security analysis** - RBAC checks, policy compliance, vulnerability scans
-☁️ **Multi-cloud management** - Provision and manage cloud infrastructure with Crossplane
+**Current Status:** I'm in Step 3 of 15 - Kubernetes integration active!
 
-**Current Status:**
-- ✅ Chat interface active
-- {k8s_status} Kubernetes client (Step 3)
-- ⏳ LangChain agents (Step 4+)
+**Available Commands:**
+- "Connect to cluster" - Connect to your Kubernetes cluster
+- "Show cluster status" - Get comprehensive cluster overview
+- "List nodes" - See all cluster nodes
+- "List pods" - Show pods in default namespace
+- "List all pods" - Show pods across all namespaces
+- "List namespaces" - Show all cluster namespaces
 
-Try asking: "Connect to cluster" or "Show cluster status" """
+**Try asking:**
+- "Hello" or "What can you do?"
+- "Show me cluster status"
+- "Tell me about Crossplane integration" """
 
-        elif 'connect' in message_lower and 'cluster' in message_lower:
-            if not KUBERNETES_AVAILABLE:
-                return "❌ Kubernetes client not available. Install requirements: `pip install -r requirements.txt`"
-            
-            if not self.k8s_ops:
-                return "❌ Kubernetes operations not initialized. Check configuration."
-            
-            try:
-                return self.k8s_ops.connect_to_cluster()
-            except Exception as e:
-                return f"❌ Connection failed: {str(e)}\n\nTroubleshooting:\n- Check kubectl config: `kubectl cluster-info`\n- Verify kubeconfig: `~/.kube/config`"
-        
-        elif 'cluster' in message_lower and ('status' in message_lower or 'overview' in message_lower):
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops:
-                return "❌ Kubernetes client not available."
-            
-            if not self.k8s_ops.is_connected():
-                return "❌ Not connected to cluster. Ask me to 'connect to cluster' first."
-            
-            return self.k8s_ops.get_cluster_overview()
-        
-        elif 'nodes' in message_lower or 'node' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_cluster_nodes()
-        
-        elif 'pods' in message_lower and 'all' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_all_pods()
-        
-        elif 'pods' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            # Check if specific namespace mentioned
-            namespace = "default"
-            if 'namespace' in message_lower:
-                words = message_lower.split()
-                try:
-                    ns_index = words.index('namespace')
-                    if ns_index + 1 < len(words):
-                        namespace = words[ns_index + 1]
-                except ValueError:
-                    pass
-            
-            return self.k8s_ops.list_pods_in_namespace(namespace)
-        
-        elif 'namespaces' in message_lower or 'namespace' in message_lower:
-            if not KUBERNETES_AVAILABLE or not self.k8s_ops or not self.k8s_ops.is_connected():
-                return "❌ Connect to cluster first: ask me to 'connect to cluster'"
-            
-            return self.k8s_ops.list_namespaces()
-        
-        elif 'status' in message_lower or 'health' in message_lower:
-            # Try to get cluster status if connected
-            cluster_status = ""
-            if KUBERNETES_AVAILABLE and self.k8s_ops and self.k8s_ops.is_connected():
-                cluster_status = "\n\n" + self.k8s_ops.get_cluster_overview()
-            elif KUBERNETES_AVAILABLE and self.k8s_ops:
-                cluster_status = "\n\n" + self.k8s_ops.get_connection_status()
-            
-            return f"""📊 **System Status:**
+_RESP_STATUS_TEMPLATE = """📊 **System Status:**
 - 🤖 KubeGenie Chat: ✅ Active
 - 🔗 Kubernetes Client: {k8s_status}
 - 🧠 LangChain Agents: ⏳ In development (Step 4+)
@@ -152,8 +83,7 @@ Step 2: ✅ Basic Gradio interface
 Step 3: ✅ Kubernetes client setup (current)
 Step 4: 🔄 LangChain basic agent{cluster_status}"""
 
-        elif 'capabilities' in message_lower or 'what can you do' in message_lower:
-            return """🚀 **KubeGenie Capabilities (Full Roadmap):**
+_RESP_CAPABILITIES = """🚀 **KubeGenie Capabilities (Full Roadmap):**
 
 **Phase 1: Foundation**
 - ✅ Conversational chat interface
@@ -174,60 +104,73 @@ Step 4: 🔄 LangChain basic agent{cluster_status}"""
 
 **Current Progress:** Step 3 of 15 complete"""
 
-        elif 'crossplane' in message_lower or 'cloud' in message_lower:
-            return """☁️ **Crossplane Multi-Cloud Integration:**
-
-**Planned for Step 13** - This will be a game-changer!
-
-**What Crossplane Adds:**
-- 🌐 **Multi-cloud provisioning**: AWS, GCP, Azure resources via Kubernetes APIs
-- 🔧 **Infrastructure as Code**: Declarative cloud resource management
-- 🎛️ **Platform Engineering**: Self-service infrastructure for dev teams
-- 💰 **Cross-cloud cost optimization**: Unified cost management
-- 🔒 **Policy-driven governance**: Automated compliance across clouds
-
-**Example Future Commands:**
-- "Create a staging environment in GCP"
-- "Add S3 and RDS to payments namespace"  
-- "Show cloud cost breakdown by team"
-- "Provision disaster recovery in another region" """
-
-        else:
-            return f"""🤔 I understand you said: "{message}"
-
-**Current Status:** I'm in Step 3 of 15 - Kubernetes integration active!
 
-**Available Commands:**
-- "Connect to cluster" - Connect to your Kubernetes cluster
-- "Show cluster status" - Get comprehensive cluster overview
-- "List nodes" - See all cluster nodes
-- "List pods" - Show pods in default namespace
-- "List all pods" - Show pods across all namespaces
-- "List namespaces" - Show all cluster namespaces
-
-**Try asking:**
-- "Hello" or "What can you do?"
-- "Show me cluster status"
-- "Tell me about Crossplane integration" """
+class KubeGenieChatFixed(_BaseKubeGenieChat):
+    """Main chat interface for KubeGenie AI Kubernetes Assistant - Fixed Version"""
+    
+    _RESPONSES = MappingProxyType({
+        **_BaseKubeGenieChat._RESPONSES,
+        "status": _RESP_STATUS_TEMPLATE,
+        "capabilities": _RESP_CAPABILITIES,
+        "fallback": _RESP_FALLBACK_TEMPLATE
+    })
+    
+    def process_user_message(self, message: str, history: List[Dict[str, str]]) -> tuple:
+        """Process user message and return updated history"""
+        
+        if not message or message.isspace():
+            return history, ""
+        
+        # Generate response based on message
+        response = self._dispatch(message)
+        
+        # Add both user message and assistant response to history (in place; Gradio re-renders the returned list)
+        history.append({"role": "user", "content": message})
+        history.append({"role": "assistant", "content": response})
+        
+        return history, ""
+    
+    def process_user_messages(self, messages: List[str], histories: List[List[Dict[str, str]]]) -> Tuple[List, List]:
+        """Batched process_user_message: Gradio passes queued submissions as parallel lists"""
+        results = [self.process_user_message(message, history) for message, history in zip(messages, histories, strict=True)]
+        return [history for history, _ in results], [cleared for _, cleared in results]
+    
+    @staticmethod
+    @lru_cache(maxsize=INTENT_CACHE_SIZE)
+    def _route(message: str) -> Optional[Callable[..., str]]:
+        """Handler for the first route whose keywords all appear in the message, if any"""
+        keywords = {match.lastgroup for match in _KEYWORD_RE.finditer(message)}
+        if keywords:
+            for required, handler in KubeGenieChatFixed._INTENT_ROUTES:
+                if required <= keywords:
+                    return handler
+        return None
+    
+    # Intents in priority order: the first route whose keywords were all found wins
+    _INTENT_ROUTES = (
+        (frozenset({"greeting"}), _BaseKubeGenieChat._reply_greeting),
+        (frozenset({"connect", "cluster"}), _BaseKubeGenieChat._reply_connect),
+        (frozenset({"cluster", "status"}), _BaseKubeGenieChat._reply_cluster_status),
+        (frozenset({"cluster", "overview"}), _BaseKubeGenieChat._reply_cluster_status),
+        (frozenset({"nodes"}), _BaseKubeGenieChat._reply_nodes),
+        (frozenset({"pods", "all"}), _BaseKubeGenieChat._reply_all_pods),
+        (frozenset({"pods"}), _BaseKubeGenieChat._reply_pods),
+        (frozenset({"namespace"}), _BaseKubeGenieChat._reply_namespaces),
+        (frozenset({"status"}), _BaseKubeGenieChat._reply_status),
+        (frozenset({"health"}), _BaseKubeGenieChat._reply_status),
+        (frozenset({"capabilities"}), _BaseKubeGenieChat._reply_capabilities),
+        (frozenset({"cloud"}), _BaseKubeGenieChat._reply_crossplane),
+    )
 
     def create_interface(self) -> gr.Blocks:
         """Create and configure the Gradio chat interface"""
-        
-        # Custom CSS for KubeGenie styling
-        custom_css = """
-        .gradio-container {
-            max-width: 1200px !important;
-        }
-        .chat-message {
-            font-size: 14px !important;
-        }
-        """
+        import gradio as gr
         
         # Create the chat interface
         with gr.Blocks(
             title="KubeGenie - AI Kubernetes Assistant",
             theme=gr.themes.Soft(),
-            css=custom_css
+            css=_CUSTOM_CSS
         ) as interface:
             
             gr.Markdown("""
@@ -256,16 +199,20 @@ Step 4: 🔄 LangChain basic agent{cluster_status}"""
             
             # Status indicators
             with gr.Row():
-                k8s_indicator = "✅ Ready" if KUBERNETES_AVAILABLE else "❌ Not available"
-                gr.Markdown(f"**Status:** 🤖 Chat: ✅ | 🔗 K8s: {k8s_indicator} | 🧠 Agents: ⏳ | 📊 Observability: ⏳")
+                gr.Markdown(f"**Status:** 🤖 Chat: ✅ | 🔗 K8s: {_K8S_STATUS_STR} | 🧠 Agents: ⏳ | 📊 Observability: ⏳")
             
             # Handle message submission
             msg.submit(
-                fn=self.process_user_message,
+                fn=self.process_user_messages,
                 inputs=[msg, chatbot],
-                outputs=[chatbot, msg]
+                outputs=[chatbot, msg],
+                batch=True,
+                max_batch_size=CHAT_MAX_BATCH_SIZE
             )
-            
+        
+        # Queue submissions so concurrent users are served in batches
+        interface.queue(max_size=CHAT_QUEUE_SIZE, default_concurrency_limit=CHAT_CONCURRENCY_LIMIT)
+        
         return interface
 
 
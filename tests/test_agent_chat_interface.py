@@ -0,0 +1,97 @@
+"""Status caching in the agent chat interface"""
+
+import pytest
+
+from src.ui import agent_chat_interface
+from src.ui.agent_chat_interface import STATUS_CACHE_TTL, KubeGenieAgentChat
+
+
+class _Agent:
+    def __init__(self):
+        self.status_calls = 0
+        self.connected = False
+        self.streamed = []
+    
+    def stream(self, message):
+        self.streamed.append(message)
+        yield "🔧 Running `list_pods`...\n\n"
+        yield "2 pods"
+    
+    def get_connection_status(self):
+        self.status_calls += 1
+        return {
+            "langchain_available": True,
+            "llm_initialized": True,
+            "k8s_available": True,
+            "k8s_connected": self.connected,
+            "session_id": "test"
+        }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(agent_chat_interface.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def chat():
+    # Skip __init__ so no real agent is created
+    chat = KubeGenieAgentChat.__new__(KubeGenieAgentChat)
+    chat.agent = _Agent()
+    chat._interface = None
+    chat._status_cache = (0.0, "")
+    return chat
+
+
+def test_status_reused_within_ttl(chat, clock):
+    first = chat._get_status_message()
+    clock[0] += STATUS_CACHE_TTL / 2
+    assert chat._get_status_message() == first
+    assert chat.agent.status_calls == 1
+
+
+def test_status_refreshed_after_ttl(chat, clock):
+    chat._get_status_message()
+    chat.agent.connected = True
+    clock[0] += STATUS_CACHE_TTL
+    assert "Kubernetes: Connected" in chat._get_status_message()
+    assert chat.agent.status_calls == 2
+
+
+def test_invalidate_status(chat, clock):
+    chat._get_status_message()
+    chat.invalidate_status()
+    chat._get_status_message()
+    assert chat.agent.status_calls == 2
+
+
+async def _replies(chat, message, history):
+    """Text of the last chat message at each update process_message yields"""
+    return [snapshot[-1]["content"] async for snapshot, _ in chat.process_message(message, history) if snapshot]
+
+
+@pytest.mark.asyncio
+async def test_every_message_reaches_the_agent(chat):
+    history = []
+    await _replies(chat, "list pods", history)
+    await _replies(chat, "list pods", history)
+    
+    # Repeated prompts are not answered from a cache, so the agent's memory sees every turn
+    assert chat.agent.streamed == ["list pods", "list pods"]
+    assert len(history) == 4
+
+
+@pytest.mark.asyncio
+async def test_tool_progress_is_rendered_before_the_answer(chat):
+    replies = await _replies(chat, "list pods", [])
+    assert replies[0] == "🔧 Running `list_pods`...\n\n"
+    assert replies[-1] == "🔧 Running `list_pods`...\n\n2 pods"
+
+
+@pytest.mark.asyncio
+async def test_blank_message_is_ignored(chat):
+    history = []
+    assert await _replies(chat, "   ", history) == []
+    assert history == [] and chat.agent.streamed == []
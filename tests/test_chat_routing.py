@@ -0,0 +1,65 @@
+"""Intent routing of the keyword chat interfaces"""
+
+import pytest
+
+from src.ui.chat_base import _BaseKubeGenieChat
+from src.ui.chat_interface import KubeGenieChat
+from src.ui.chat_interface_fixed import KubeGenieChatFixed
+
+
+@pytest.fixture
+def chat():
+    # Skip __init__ so no Kubernetes operations are created
+    chat = KubeGenieChat.__new__(KubeGenieChat)
+    chat.conversation_history = []
+    chat.k8s_ops = None
+    chat.k8s_available = False
+    chat.cluster_connected = False
+    return chat
+
+
+def _handler_name(handler):
+    return handler.__name__ if handler else None
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Hello there", "_reply_greeting"),
+    ("Please CONNECT to my cluster", "_reply_connect"),
+    ("cluster overview please", "_reply_cluster_status"),
+    ("show all pods", "_reply_all_pods"),
+    ("pods in namespace kube-system", "_reply_pods"),
+    ("list namespaces", "_reply_namespaces"),
+    ("what can you do", "_reply_capabilities"),
+    ("tell me about crossplane", "_reply_crossplane"),
+    ("disconnect cluster", "_reply_cluster"),
+    ("things are fine", None),
+])
+def test_chat_routes(chat, message, expected):
+    assert _handler_name(chat._route(message)) == expected
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("hey", "_reply_greeting"),
+    ("connect cluster", "_reply_connect"),
+    ("Cluster status", "_reply_cluster_status"),
+    ("nodes", "_reply_nodes"),
+    ("all pods", "_reply_all_pods"),
+    ("health check", "_reply_status"),
+    ("disconnect cluster", None),
+    ("things are fine", None),
+])
+def test_fixed_chat_routes(message, expected):
+    assert _handler_name(KubeGenieChatFixed._route(message)) == expected
+
+
+def test_disconnect_never_connects(chat):
+    for route in (chat._route, KubeGenieChatFixed._route):
+        assert route("disconnect from the cluster") is not _BaseKubeGenieChat._reply_connect
+
+
+def test_connect_without_kubernetes_operations(chat):
+    assert chat._dispatch("connect to cluster").startswith("❌")
+
+
+def test_pods_reply_requires_connection(chat):
+    assert chat._dispatch("show pods in namespace web").startswith("❌ Connect to cluster first")
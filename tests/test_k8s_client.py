@@ -0,0 +1,132 @@
+"""Caches, watch relisting and pod counting in the Kubernetes client"""
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from src.tools import k8s_client
+from src.tools.k8s_client import (
+    KubernetesClient,
+    STALE_MESSAGE_PREFIX,
+    _ResourceCache,
+    _ResourceWatcher,
+)
+
+
+class _Clock:
+    """Stand-in for time.monotonic that only moves when told to"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(k8s_client.time, "monotonic", clock)
+    return clock
+
+
+def test_resource_cache_expires_after_ttl(clock):
+    cache = _ResourceCache(ttl=5.0)
+    cache.put(("nodes",), "value")
+    
+    clock.now += 4.9
+    assert cache.get(("nodes",)) == "value"
+    
+    clock.now += 0.2
+    assert cache.get(("nodes",)) is None
+    assert cache.get_stale(("nodes",)) == "value"
+
+
+def test_resource_cache_clear():
+    cache = _ResourceCache()
+    cache.put(("nodes",), "value")
+    cache.clear()
+    assert cache.get_stale(("nodes",)) is None
+
+
+def test_stale_fallback_after_failed_refresh(clock):
+    client = KubernetesClient()
+    client._connected = True
+    client._resource_cache.put(("namespaces",), (True, ["default"], "✅ Found 1 namespaces"))
+    clock.now += k8s_client.RESOURCE_CACHE_TTL + 1
+    
+    def fail():
+        raise ApiException(status=503, reason="Service Unavailable")
+    client._namespace_names = fail
+    
+    success, namespaces, message = client.list_namespaces()
+    assert success
+    assert namespaces == ["default"]
+    assert message.startswith(STALE_MESSAGE_PREFIX)
+    assert "Service Unavailable" in message
+
+
+def test_failed_refresh_without_cached_result(clock):
+    client = KubernetesClient()
+    client._connected = True
+    
+    def fail():
+        raise RuntimeError("boom")
+    client._namespace_names = fail
+    
+    assert client.list_namespaces() == (False, [], "❌ Error listing namespaces: boom")
+
+
+def test_watcher_relists_after_410():
+    watcher = _ResourceWatcher(lambda **kwargs: None, lambda obj: obj, "test")
+    relists = []
+    follows = []
+    
+    def relist():
+        relists.append(True)
+        if len(relists) == 2:
+            watcher._stopped.set()
+        return str(len(relists))
+    
+    def follow(resource_version):
+        follows.append(resource_version)
+        raise ApiException(status=410, reason="Gone")
+    
+    watcher._relist = relist
+    watcher._follow = follow
+    watcher._run()
+    
+    # The compacted version is dropped and the watch resumes from a fresh list
+    assert len(relists) == 2
+    assert follows == ["1", "2"]
+
+
+def test_count_pods_uses_remaining_item_count():
+    client = KubernetesClient()
+    calls = []
+    
+    def list_metadata(path, **query):
+        calls.append((path, query))
+        return {"items": [{"metadata": {"name": "a"}}], "metadata": {"remainingItemCount": 41}}
+    client._list_metadata = list_metadata
+    
+    assert client.count_pods() == 42
+    assert calls == [("/api/v1/pods", {"limit": "1", "resourceVersion": None, "resourceVersionMatch": None})]
+
+
+def test_count_pods_single_page():
+    client = KubernetesClient()
+    client._list_metadata = lambda path, **query: {"items": [{}], "metadata": {}}
+    assert client.count_pods() == 1
+
+
+def test_count_pods_by_phase_counts_items():
+    client = KubernetesClient()
+    queries = []
+    
+    def list_metadata(path, **query):
+        queries.append(query)
+        return {"items": [{}, {}, {}], "metadata": {"remainingItemCount": 99}}
+    client._list_metadata = list_metadata
+    
+    assert client.count_pods("Running") == 3
+    assert queries == [{"fieldSelector": "status.phase=Running"}]